@@ -4,7 +4,7 @@
 import logging
 import sqlite3
 from datetime import datetime
-from trendscout.store import DataStore
+from trendscout.store import DataStore, SQLiteCache
 from trendscout.scrape import AppScraper
 from trendscout.score import AppScorer
 from trendscout.models import RawAppRecord, AppPageData
@@ -24,6 +24,7 @@ def recover_data():
     
     # Get cached rank data
     cache_db_path = "/Users/billyjo182/.trendscout/cache.db"
+    cache = SQLiteCache(cache_db_path)
     
     with sqlite3.connect(cache_db_path) as conn:
         conn.row_factory = sqlite3.Row
@@ -50,16 +51,10 @@ def recover_data():
             chart = rank_record['chart']
             rank = rank_record['rank']
             
-            # Get cached HTML
-            html_cursor = conn.execute("""
-                SELECT html FROM app_html_cache 
-                WHERE app_id = ? AND country = ?
-            """, (app_id, country))
-            
-            html_row = html_cursor.fetchone()
-            if html_row:
-                html = html_row['html']
-                
+            # Get cached HTML through SQLiteCache so compressed rows are
+            # decoded via their codec flag; recovery accepts any age
+            html = cache.get_html(app_id, country, max_age_hours=10 * 365 * 24)
+            if html is not None:
                 try:
                     # Parse the cached HTML
                     app_data = scraper.parse_app_page(html, app_id)
@@ -174,6 +174,44 @@ class TestRSSFetcher:
         assert len(records) == 1
         assert records[0].app_id == "123456789"
     
+    def test_fetch_rss_data_with_httpx_client(self):
+        """Test fetching through an httpx client (no stream= kwarg)."""
+        httpx = pytest.importorskip("httpx")
+
+        feed_xml = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:im="http://itunes.apple.com/rss">
+  <title>Top Free Apps</title>
+  <entry>
+    <title>Calculator</title>
+    <link rel="alternate" href="https://apps.apple.com/us/app/calculator/id123456789"/>
+    <im:artist>Example Developer</im:artist>
+  </entry>
+  <entry>
+    <title>Timer</title>
+    <link rel="alternate" href="https://apps.apple.com/us/app/timer/id987654321"/>
+    <im:artist>Another Developer</im:artist>
+  </entry>
+</feed>"""
+
+        def handler(request):
+            return httpx.Response(
+                200, content=feed_xml,
+                headers={"content-type": "application/atom+xml"}
+            )
+
+        fetcher = RSSFetcher()
+        fetcher.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+        rss_data = fetcher.fetch_rss_data(
+            "https://itunes.apple.com/us/rss/topfreeapplications/limit=2/genre=6002/xml"
+        )
+
+        assert rss_data["feed"]["title"] == "Top Free Apps"
+        entries = rss_data["feed"]["entries"]
+        assert len(entries) == 2
+        assert entries[0]["link"].endswith("id123456789")
+        assert entries[1]["title"] == "Timer"
+
     @patch('trendscout.rss.time.sleep')
     def test_collect_all(self, mock_sleep):
         """Test collecting all configured combinations."""
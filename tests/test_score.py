@@ -327,4 +327,81 @@ class TestAppScorer:
         
         # Should only return records for apps with data
         assert len(scored_records) == 1
-        assert scored_records[0].app_id == "123"
\ No newline at end of file
+        assert scored_records[0].app_id == "123"
+    def test_score_apps_vectorized_matches_scalar(self):
+        """Test that vectorized batch scoring matches the scalar path."""
+        scorer = AppScorer()
+
+        raw_records = [
+            RawAppRecord(
+                category="Utilities", country="US", chart="free", rank=1,
+                app_id="123", name="Simple Timer Widget", rss_url="https://example.com",
+                fetched_at=datetime.utcnow()
+            ),
+            RawAppRecord(
+                category="Games", country="CA", chart="paid", rank=2,
+                app_id="456", name="Official Disney Game", rss_url="https://example.com",
+                fetched_at=datetime.utcnow()
+            ),
+            RawAppRecord(
+                category="Finance", country="GB", chart="free", rank=3,
+                app_id="789", name="Enterprise Analytics", rss_url="https://example.com",
+                fetched_at=datetime.utcnow()
+            )
+        ]
+
+        app_data_map = {
+            "123": AppPageData(
+                bundle_id="com.app1", price=0.0, has_iap=False,
+                rating_count=100, rating_avg=3.0, desc_len=100
+            ),
+            "456": AppPageData(
+                bundle_id="com.app2", price=2.99, has_iap=True,
+                rating_count=50000, rating_avg=4.5, desc_len=300,
+                recent_reviews=["Great!", "Love it", "Amazing"]
+            ),
+            "789": AppPageData(
+                bundle_id="com.app3", price=0.0, has_iap=True,
+                rating_count=2500, rating_avg=4.0, desc_len=500
+            )
+        }
+
+        rank_deltas = {"123": -12, "456": 8}
+
+        # Sweep a grid of score combinations so half-way rounding cases
+        # (e.g. a weighted total of 3.225) are exercised, not just the
+        # three hand-picked records above
+        names = [
+            "Simple Timer Widget", "Official Disney Game", "Enterprise Analytics",
+            "Basic Photo Filter", "Pro Sync Platform", "Counter"
+        ]
+        delta_values = [-12, -7, -3, 0, 3, 8, None]
+        count_values = [50, 500, 5000, 50000]
+        price_values = [0.0, 2.99]
+        reviews_values = [None, ["Great!", "Love it", "Amazing"]]
+        app_id = 1000
+        for name in names:
+            for delta in delta_values:
+                for rating_count in count_values:
+                    for price in price_values:
+                        for reviews in reviews_values:
+                            app_id += 1
+                            raw_records.append(RawAppRecord(
+                                category="Utilities", country="US", chart="free",
+                                rank=(app_id % 25) + 1, app_id=str(app_id), name=name,
+                                rss_url="https://example.com", fetched_at=datetime.utcnow()
+                            ))
+                            app_data_map[str(app_id)] = AppPageData(
+                                bundle_id=f"com.app{app_id}", price=price,
+                                has_iap=bool(app_id % 2), rating_count=rating_count,
+                                rating_avg=4.0, desc_len=200, recent_reviews=reviews
+                            )
+                            if delta is not None:
+                                rank_deltas[str(app_id)] = delta
+
+        scalar = scorer.score_apps(raw_records, app_data_map, rank_deltas)
+        vectorized = scorer.score_apps_vectorized(raw_records, app_data_map, rank_deltas)
+
+        assert len(vectorized) == len(scalar)
+        for scalar_record, vector_record in zip(scalar, vectorized):
+            assert vector_record == scalar_record
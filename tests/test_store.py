@@ -116,6 +116,71 @@ class TestSQLiteCache:
         retrieved_old = temp_cache.get_html(app_id, country, max_age_hours=0)
         assert retrieved_old is None
     
+    def test_migrate_app_ranks_from_rowid_schema(self):
+        """Test reopening a database created with the old rowid schema."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            with sqlite3.connect(f.name) as conn:
+                conn.executescript("""
+                    CREATE TABLE app_ranks (
+                        app_id TEXT,
+                        category TEXT,
+                        country TEXT,
+                        chart TEXT,
+                        rank INTEGER,
+                        date TEXT,
+                        PRIMARY KEY (app_id, category, country, chart, date)
+                    );
+                    INSERT INTO app_ranks
+                    VALUES ('123', 'Utilities', 'US', 'free', 5, '2026-08-01');
+                """)
+
+            cache = SQLiteCache(f.name)
+
+            table_sql = cache._conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name='app_ranks'"
+            ).fetchone()[0]
+            assert "WITHOUT ROWID" in table_sql
+
+            # Existing rows survive the rebuild
+            row = cache._conn.execute(
+                "SELECT app_id, rank, date FROM app_ranks"
+            ).fetchone()
+            assert tuple(row) == ("123", 5, "2026-08-01")
+
+            cache.close()
+            Path(f.name).unlink(missing_ok=True)
+
+    def test_store_html_many(self, temp_cache):
+        """Test bulk HTML storage round-trips every item."""
+        items = [
+            ("111", "us", "<html><body>First app</body></html>"),
+            ("222", "us", "<html><body>Second app</body></html>"),
+            ("333", "ca", "<html><body>Third app</body></html>"),
+        ]
+
+        temp_cache.store_html_many(items)
+
+        for app_id, country, html in items:
+            assert temp_cache.get_html(app_id, country, max_age_hours=24) == html
+
+        # Empty input is a no-op
+        temp_cache.store_html_many([])
+
+    def test_get_html_legacy_uncompressed_row(self, temp_cache):
+        """Test reading a raw TEXT row written before compression existed."""
+        html_content = "<html><body>Legacy page</body></html>"
+
+        with sqlite3.connect(temp_cache.db_path) as conn:
+            # Older versions stored plain text and naive timestamps, with
+            # no compressed flag (the column defaults to 0)
+            conn.execute("""
+                INSERT INTO app_html_cache (app_id, country, html, cached_at)
+                VALUES ('999', 'us', ?, ?)
+            """, (html_content, datetime.utcnow().isoformat()))
+
+        retrieved = temp_cache.get_html("999", "us", max_age_hours=24)
+        assert retrieved == html_content
+
     def test_cleanup_old_data(self, temp_cache):
         """Test cleaning up old cache data."""
         with sqlite3.connect(temp_cache.db_path) as conn:
@@ -230,16 +295,12 @@ class TestSupabasePublisher:
         # Mock Supabase client
         mock_client = Mock()
         mock_table = Mock()
-        mock_delete = Mock()
-        mock_insert = Mock()
+        mock_upsert = Mock()
         
         mock_create_client.return_value = mock_client
         mock_client.table.return_value = mock_table
-        mock_table.delete.return_value = mock_delete
-        mock_delete.eq.return_value = mock_delete
-        mock_delete.execute.return_value = None
-        mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = Mock(data=[{"id": "test"}])
+        mock_table.upsert.return_value = mock_upsert
+        mock_upsert.execute.return_value = Mock(data=[{"id": "test"}])
         
         publisher = SupabasePublisher(
             url='https://test.supabase.co',
@@ -261,7 +322,7 @@ class TestSupabasePublisher:
         
         assert result is True
         mock_client.table.assert_called_with("scout_results")
-        mock_table.insert.assert_called_once()
+        mock_table.upsert.assert_called_once()
     
     @patch('trendscout.store.create_client')
     def test_check_connection_success(self, mock_create_client):
@@ -314,16 +375,12 @@ class TestDataStore:
         # Mock Supabase operations first
         mock_client = Mock()
         mock_table = Mock()
-        mock_delete = Mock()
-        mock_insert = Mock()
+        mock_upsert = Mock()
         
         mock_create_client.return_value = mock_client
         mock_client.table.return_value = mock_table
-        mock_table.delete.return_value = mock_delete
-        mock_delete.eq.return_value = mock_delete
-        mock_delete.execute.return_value = None
-        mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = Mock(data=[{"id": "test"}])
+        mock_table.upsert.return_value = mock_upsert
+        mock_upsert.execute.return_value = Mock(data=[{"id": "test"}])
         
         # Now create the data store with mocked Supabase
         with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
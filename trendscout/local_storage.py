@@ -8,8 +8,33 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import shutil
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+def _dump_json(file_path: Path, data) -> None:
+    """Write JSON to disk, using orjson's C encoder when installed."""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+def _load_json(file_path: Path):
+    """Read JSON from disk, using orjson's C decoder when installed."""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path) as f:
+        return json.load(f)
+
 class LocalDataStorage:
     """Manages local data storage with timestamp versioning."""
     
@@ -37,22 +62,19 @@ class LocalDataStorage:
             # Save scout results (raw collected data)
             if 'scout_results' in data:
                 scout_file = run_path / "scout_results.json"
-                with open(scout_file, 'w') as f:
-                    json.dump(data['scout_results'], f, indent=2, default=str)
+                _dump_json(scout_file, data['scout_results'])
                 logger.info(f"💾 Saved {len(data['scout_results'])} scout results")
             
             # Save trending selections
             if 'trending_selections' in data:
                 trending_file = run_path / "trending_selections.json"
-                with open(trending_file, 'w') as f:
-                    json.dump(data['trending_selections'], f, indent=2, default=str)
+                _dump_json(trending_file, data['trending_selections'])
                 logger.info(f"💾 Saved {len(data['trending_selections'])} trending selections")
             
             # Save AI recommendations
             if 'ai_recommendations' in data:
                 ai_file = run_path / "ai_recommendations.json"
-                with open(ai_file, 'w') as f:
-                    json.dump(data['ai_recommendations'], f, indent=2, default=str)
+                _dump_json(ai_file, data['ai_recommendations'])
                 logger.info(f"💾 Saved {len(data['ai_recommendations'])} AI recommendations")
             
             # Save run metadata
@@ -66,8 +88,7 @@ class LocalDataStorage:
             }
             
             metadata_file = run_path / "run_metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2, default=str)
+            _dump_json(metadata_file, metadata)
             
             logger.info(f"✅ Saved complete run data to {run_path}")
             return True
@@ -90,8 +111,7 @@ class LocalDataStorage:
                     metadata_file = run_dir / "run_metadata.json"
                     metadata = {}
                     if metadata_file.exists():
-                        with open(metadata_file) as f:
-                            metadata = json.load(f)
+                        metadata = _load_json(metadata_file)
                     
                     runs.append({
                         'directory': str(run_dir),
@@ -160,26 +180,22 @@ class LocalDataStorage:
             # Load scout results
             scout_file = run_path / "scout_results.json"
             if scout_file.exists():
-                with open(scout_file) as f:
-                    data['scout_results'] = json.load(f)
+                data['scout_results'] = _load_json(scout_file)
             
             # Load trending selections
             trending_file = run_path / "trending_selections.json"
             if trending_file.exists():
-                with open(trending_file) as f:
-                    data['trending_selections'] = json.load(f)
+                data['trending_selections'] = _load_json(trending_file)
             
             # Load AI recommendations
             ai_file = run_path / "ai_recommendations.json"
             if ai_file.exists():
-                with open(ai_file) as f:
-                    data['ai_recommendations'] = json.load(f)
+                data['ai_recommendations'] = _load_json(ai_file)
             
             # Load metadata
             metadata_file = run_path / "run_metadata.json"
             if metadata_file.exists():
-                with open(metadata_file) as f:
-                    data['metadata'] = json.load(f)
+                data['metadata'] = _load_json(metadata_file)
             
             logger.info(f"📂 Loaded run data from {timestamp_str}")
             return data
@@ -1,8 +1,13 @@
 """RSS feed fetching and parsing for Apple App Store charts."""
 
 import logging
+import re
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from io import BytesIO
+from itertools import islice
 from typing import Dict, List, Optional
 from urllib.parse import quote
 
@@ -10,42 +15,147 @@ import feedparser
 import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401 - only probed so we never advertise br without a decoder
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
 from .models import CollectConfig, RawAppRecord
 
 logger = logging.getLogger(__name__)
 
+# XML namespaces used by the iTunes RSS feeds
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ITUNES_NS = "http://itunes.apple.com/rss"
+
+# iTunes RSS endpoint templates (supports category filtering)
+# Format: https://itunes.apple.com/{country}/rss/top{chart}applications/limit={limit}/genre={genre_id}/xml
+RSS_TEMPLATES = {
+    "free": "https://itunes.apple.com/{country}/rss/topfreeapplications/limit={limit}/genre={genre_id}/xml",
+    "paid": "https://itunes.apple.com/{country}/rss/toppaidapplications/limit={limit}/genre={genre_id}/xml"
+}
+
+# Category mappings to iTunes genre IDs
+CATEGORY_MAPPINGS = {
+    "All": None,  # No genre filter for all categories
+    "Utilities": "6002",
+    "Photo & Video": "6008",
+    "Productivity": "6007",
+    "Health & Fitness": "6013",
+    "Lifestyle": "6012",
+    "Graphics & Design": "6027",
+    "Music": "6011",
+    "Education": "6017",
+    "Finance": "6015",
+    "Entertainment": "6016"
+}
+
+# Genre-less template variants for the "All" category, derived once at
+# import instead of re-scanning the template string on every build
+RSS_TEMPLATES_ALL = {
+    chart: template.replace("/genre={genre_id}", "")
+    for chart, template in RSS_TEMPLATES.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _build_rss_url(category: str, country: str, chart: str, top_n: int) -> str:
+    """Build and memoize an RSS feed URL for the given parameters.
+
+    The builder is pure, so repeat combinations across collect runs
+    resolve to a cached string instead of re-validating and formatting.
+
+    Args:
+        category: App Store category name
+        country: Country code (US, CA, etc.)
+        chart: Chart type (free or paid)
+        top_n: Number of top apps to fetch
+
+    Returns:
+        RSS feed URL
+
+    Raises:
+        ValueError: If invalid parameters provided
+    """
+    if chart not in RSS_TEMPLATES:
+        raise ValueError(f"Invalid chart type: {chart}. Must be 'free' or 'paid'")
+
+    if category not in CATEGORY_MAPPINGS:
+        raise ValueError(f"Invalid category: {category}. Must be one of {list(CATEGORY_MAPPINGS.keys())}")
+
+    genre_id = CATEGORY_MAPPINGS[category]
+
+    # Build URL based on whether we have a genre filter
+    if genre_id is None:
+        # For "All" category, use URL without genre parameter
+        url = RSS_TEMPLATES_ALL[chart].format(
+            country=country.lower(),
+            limit=top_n
+        )
+    else:
+        url = RSS_TEMPLATES[chart].format(
+            country=country.lower(),
+            limit=top_n,
+            genre_id=genre_id
+        )
+
+    logger.debug(f"Built RSS URL: {url}")
+    return url
+
+# App ID extraction patterns, compiled once and tried in order. The
+# strict /id123456789 and app-id=123456789 forms must win before the
+# loose id123456789 fallback: app-name slugs like "rapid7" or "covid19"
+# contain id<digit> and would otherwise shadow the real ID.
+APP_ID_PATTERN_STRICT = re.compile(r'(?:/id|app-id=)(\d+)')
+APP_ID_PATTERN_LOOSE = re.compile(r'id(\d+)')
+
+
+def _label(entry: Dict, key: str) -> str:
+    """Return the label value of an im:* entry field, or empty string.
+
+    Args:
+        entry: Feed entry dict
+        key: Entry key holding a {"label": ...} sub-dict
+
+    Returns:
+        Label string, or "" if the field is missing
+    """
+    value = entry.get(key)
+    return value.get("label", "") if value else ""
+
 
 class RSSFetcher:
     """Fetches and parses Apple App Store RSS feeds."""
     
-    # iTunes RSS endpoint templates (supports category filtering)
-    # Format: https://itunes.apple.com/{country}/rss/top{chart}applications/limit={limit}/genre={genre_id}/xml
-    RSS_TEMPLATES = {
-        "free": "https://itunes.apple.com/{country}/rss/topfreeapplications/limit={limit}/genre={genre_id}/xml",
-        "paid": "https://itunes.apple.com/{country}/rss/toppaidapplications/limit={limit}/genre={genre_id}/xml"
-    }
-    
-    # Category mappings to iTunes genre IDs
-    CATEGORY_MAPPINGS = {
-        "All": None,  # No genre filter for all categories
-        "Utilities": "6002",
-        "Photo & Video": "6008", 
-        "Productivity": "6007",
-        "Health & Fitness": "6013",
-        "Lifestyle": "6012",
-        "Graphics & Design": "6027",
-        "Music": "6011",
-        "Education": "6017",
-        "Finance": "6015",
-        "Entertainment": "6016"
-    }
-    
-    def __init__(self, user_agent: str = None, rate_limit_delay: float = 2.0):
+    # Kept as class aliases for backward compatibility with existing callers
+    RSS_TEMPLATES = RSS_TEMPLATES
+    CATEGORY_MAPPINGS = CATEGORY_MAPPINGS
+
+    def __init__(
+        self,
+        user_agent: str = None,
+        rate_limit_delay: float = 2.0,
+        use_feedparser: bool = False
+    ):
         """Initialize RSS fetcher.
-        
+
         Args:
             user_agent: User agent string for requests (defaults to legitimate browser)
             rate_limit_delay: Delay between requests in seconds (increased for Apple)
+            use_feedparser: Force the pure-Python feedparser path instead of lxml
         """
         # Use a legitimate browser user agent to avoid blocking
         if user_agent is None:
@@ -55,14 +165,19 @@ class RSSFetcher:
         
         self.user_agent = user_agent
         self.rate_limit_delay = rate_limit_delay
-        self.session = requests.Session()
+        self.use_feedparser = use_feedparser or not LXML_AVAILABLE
+        self.session = self._create_session()
+
+        # Conditional-request cache: url -> (etag, last_modified, parsed feed)
+        # Unchanged feeds answer 304 with no body and reuse the parsed result
+        self._feed_cache: Dict[str, tuple] = {}
         
         # Set proper headers to mimic legitimate browser requests
         self.session.headers.update({
             "User-Agent": user_agent,
             "Accept": "application/xml, text/xml, */*",
             "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "DNT": "1",
             "Connection": "keep-alive",
             "Sec-Fetch-Dest": "empty",
@@ -71,48 +186,62 @@ class RSSFetcher:
             "Cache-Control": "no-cache",
             "Pragma": "no-cache"
         })
-    
+
+    @staticmethod
+    def _create_session():
+        """Create the HTTP client for feed fetching.
+
+        Prefers an httpx client with HTTP/2 when the optional httpx[http2]
+        extra is installed, so all feed requests multiplex over one TLS
+        session. Falls back to a plain requests.Session otherwise; both
+        expose the same get/headers surface used here.
+
+        Returns:
+            httpx.Client or requests.Session
+        """
+        if HTTPX_AVAILABLE:
+            try:
+                return httpx.Client(
+                    http2=True,
+                    timeout=30,
+                    limits=httpx.Limits(max_connections=20)
+                )
+            except ImportError:
+                # httpx installed without the h2 extra; HTTP/1.1 httpx
+                # adds little over requests, so keep the default path
+                logger.debug("httpx installed without h2 support, using requests")
+
+        # All feeds live on one host, so keep a deep pool of warm
+        # connections to it instead of churning TLS handshakes when
+        # per-country workers fetch concurrently
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        return session
+
+
     def build_rss_url(self, category: str, country: str, chart: str, top_n: int) -> str:
         """Build RSS feed URL for given parameters.
-        
+
         Args:
             category: App Store category name
             country: Country code (US, CA, etc.)
             chart: Chart type (free or paid)
             top_n: Number of top apps to fetch
-            
+
         Returns:
             RSS feed URL
-            
+
         Raises:
             ValueError: If invalid parameters provided
         """
-        if chart not in self.RSS_TEMPLATES:
-            raise ValueError(f"Invalid chart type: {chart}. Must be 'free' or 'paid'")
-        
-        if category not in self.CATEGORY_MAPPINGS:
-            raise ValueError(f"Invalid category: {category}. Must be one of {list(self.CATEGORY_MAPPINGS.keys())}")
-        
-        genre_id = self.CATEGORY_MAPPINGS[category]
-        
-        # Build URL based on whether we have a genre filter
-        if genre_id is None:
-            # For "All" category, use URL without genre parameter
-            base_url = self.RSS_TEMPLATES[chart].replace("/genre={genre_id}", "")
-            url = base_url.format(
-                country=country.lower(),
-                limit=top_n
-            )
-        else:
-            url = self.RSS_TEMPLATES[chart].format(
-                country=country.lower(),
-                limit=top_n,
-                genre_id=genre_id
-            )
-        
-        logger.debug(f"Built RSS URL: {url}")
-        return url
-    
+        return _build_rss_url(category, country, chart, top_n)
+
+
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=2, min=4, max=60),
@@ -133,44 +262,188 @@ class RSSFetcher:
             requests.RequestException: If request fails after retries
         """
         logger.info(f"Fetching RSS data from: {url}")
-        
+
         try:
-            response = self.session.get(url, timeout=30)
-            
+            # Send validators from the previous fetch so unchanged feeds
+            # come back as an empty 304 instead of a full payload
+            conditional_headers = {}
+            cached = self._feed_cache.get(url)
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    conditional_headers["If-None-Match"] = etag
+                if last_modified:
+                    conditional_headers["If-Modified-Since"] = last_modified
+
+            # Stream the body straight into the XML parser when possible
+            # (httpx clients use a different streaming API, so they buffer)
+            use_stream = not self.use_feedparser and isinstance(self.session, requests.Session)
+            get_kwargs = {"timeout": 30, "headers": conditional_headers}
+            if use_stream:
+                # Only requests accepts stream=; httpx.Client.get() would
+                # reject the kwarg with a TypeError
+                get_kwargs["stream"] = True
+            response = self.session.get(url, **get_kwargs)
+
+            if response.status_code == 304 and cached:
+                logger.info(f"Feed unchanged (304), reusing cached parse for {url}")
+                return cached[2]
+
             # Handle rate limiting specifically
             if response.status_code == 429:
                 retry_after = response.headers.get('Retry-After', '60')
                 logger.warning(f"Rate limited. Waiting {retry_after} seconds")
                 time.sleep(int(retry_after))
                 raise requests.HTTPError(f"Rate limited (429)", response=response)
-            
+
             # Handle other errors
             if response.status_code == 403:
                 logger.error(f"Access forbidden (403) - possible rate limit or blocked user agent")
                 raise requests.HTTPError(f"Access forbidden (403)", response=response)
-            
+
             response.raise_for_status()
-            
-            # Parse XML RSS response using feedparser
-            feed = feedparser.parse(response.text)
-            
-            if not feed.entries:
+
+            # Parse XML RSS response (lxml fast path, feedparser fallback)
+            if self.use_feedparser:
+                feed_title, entries = self._parse_feed_feedparser(response)
+            elif use_stream:
+                try:
+                    # Decompress transparently while lxml consumes the socket,
+                    # so the payload is never materialized as one big buffer
+                    response.raw.decode_content = True
+                    feed_title, entries = self._parse_feed_lxml(response.raw)
+                except etree.XMLSyntaxError as e:
+                    # The stream is already consumed, so fall back with a
+                    # buffered refetch through feedparser
+                    logger.warning(f"lxml failed to parse streamed feed ({e}), refetching with feedparser")
+                    feed_title, entries = self._parse_feed_feedparser(
+                        self.session.get(url, timeout=30)
+                    )
+                finally:
+                    response.close()
+            else:
+                try:
+                    feed_title, entries = self._parse_feed_lxml(response.content)
+                except etree.XMLSyntaxError as e:
+                    logger.warning(f"lxml failed to parse feed ({e}), falling back to feedparser")
+                    feed_title, entries = self._parse_feed_feedparser(response)
+
+            if not entries:
                 raise ValueError(f"No entries found in RSS feed from {url}")
-            
-            entries_count = len(feed.entries)
-            logger.info(f"Successfully fetched {entries_count} entries from RSS")
-            
-            # Convert feedparser object to dict for consistency
-            return {
+
+            logger.info(f"Successfully fetched {len(entries)} entries from RSS")
+
+            # Keep the dict shape parse_rss_entries expects
+            result = {
                 "feed": {
-                    "title": feed.feed.get("title", ""),
-                    "entries": feed.entries
+                    "title": feed_title,
+                    "entries": entries
                 }
             }
-            
+
+            # Remember the validators (and parse) for the next conditional GET
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._feed_cache[url] = (etag, last_modified, result)
+
+            return result
+
         except Exception as e:
             logger.error(f"Request failed for {url}: {e}")
             raise
+
+    def _parse_feed_feedparser(self, response) -> tuple:
+        """Parse an RSS response with feedparser (pure-Python fallback).
+
+        Args:
+            response: HTTP response containing feed XML
+
+        Returns:
+            Tuple of (feed title, list of entry dicts)
+        """
+        # Hand feedparser the raw bytes plus the HTTP-declared encoding so
+        # neither requests nor feedparser runs charset detection on the body
+        feed = feedparser.parse(
+            response.content,
+            response_headers={"content-type": response.headers.get("content-type", "")}
+        )
+        return feed.feed.get("title", ""), feed.entries
+
+    def _parse_feed_lxml(self, source) -> tuple:
+        """Incrementally parse iTunes RSS XML with lxml's C parser.
+
+        Accepts raw bytes or a file-like stream (e.g. response.raw), so
+        the feed can be parsed while it downloads without buffering the
+        whole payload. Entries are extracted on their closing tag and
+        freed immediately, and entry dicts mirror feedparser's shape so
+        downstream parsing is unchanged.
+
+        Args:
+            source: Raw feed XML bytes or a readable binary stream
+
+        Returns:
+            Tuple of (feed title, list of entry dicts)
+
+        Raises:
+            etree.XMLSyntaxError: If the XML cannot be parsed
+        """
+        if isinstance(source, bytes):
+            source = BytesIO(source)
+
+        entry_tag = f"{{{ATOM_NS}}}entry"
+        title_tag = f"{{{ATOM_NS}}}title"
+
+        feed_title = ""
+        entries = []
+
+        for _, elem in etree.iterparse(source, events=("end",), tag=(entry_tag, title_tag)):
+            if elem.tag == title_tag:
+                # Only the feed-level title; entries have their own titles
+                parent = elem.getparent()
+                if parent is not None and parent.tag != entry_tag and not feed_title:
+                    feed_title = elem.text or ""
+                continue
+
+            link = ""
+            for link_elem in elem.iterfind(f"{{{ATOM_NS}}}link"):
+                href = link_elem.get("href", "")
+                if href and link_elem.get("rel", "alternate") == "alternate":
+                    link = href
+                    break
+
+            entries.append({
+                "title": elem.findtext(title_tag, default=""),
+                "link": link,
+                "summary": elem.findtext(f"{{{ATOM_NS}}}summary", default=""),
+                "im_releasedate": self._itunes_label(elem, "releaseDate"),
+                "im_artist": self._itunes_label(elem, "artist"),
+                "im_price": self._itunes_label(elem, "price"),
+                "im_contenttype": self._itunes_label(elem, "contentType"),
+            })
+
+            # Release the parsed subtree to keep memory flat
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        return feed_title, entries
+
+    @staticmethod
+    def _itunes_label(entry, tag: str) -> Optional[Dict[str, str]]:
+        """Extract an im:* element as feedparser's {"label": ...} dict.
+
+        Args:
+            entry: lxml entry element
+            tag: iTunes namespace tag name (without prefix)
+
+        Returns:
+            Dict with label value, or None if the element is missing
+        """
+        elem = entry.find(f"{{{ITUNES_NS}}}{tag}")
+        if elem is None:
+            return None
+        return {"label": elem.get("label") or elem.text or ""}
     
     def parse_rss_entries(
         self,
@@ -195,12 +468,14 @@ class RSSFetcher:
             List of RawAppRecord objects
         """
         records = []
-        fetched_at = datetime.utcnow()
+        # One timestamp shared by every record in this parse; utcnow() is
+        # deprecated and slower than the tz-aware form
+        fetched_at = datetime.now(timezone.utc)
         
         feed = rss_data.get("feed", {})
         entries = feed.get("entries", [])
         
-        for rank, entry in enumerate(entries[:max_results], 1):
+        for rank, entry in enumerate(islice(entries, max_results), 1):
             try:
                 # Extract app ID from link
                 app_url = entry.get("link", "")
@@ -210,25 +485,28 @@ class RSSFetcher:
                     logger.warning(f"Could not extract app ID from URL: {app_url}")
                     continue
                 
-                # Convert feedparser entry to dict for raw_data
+                title = entry.get("title", "")
+
+                # Convert feed entry to dict for raw_data (kept as a plain
+                # dict: it is stored as-is in the JSONB `raw` column)
                 raw_data = {
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
+                    "title": title,
+                    "link": app_url,
                     "summary": entry.get("summary", ""),
-                    "published": entry.get("im_releasedate", {}).get("label", "") if entry.get("im_releasedate") else "",
-                    "artist": entry.get("im_artist", {}).get("label", "") if entry.get("im_artist") else "",
+                    "published": _label(entry, "im_releasedate"),
+                    "artist": _label(entry, "im_artist"),
                     "category": category,  # We already filtered by category in URL
-                    "price": entry.get("im_price", {}).get("label", "") if entry.get("im_price") else "",
-                    "content_type": entry.get("im_contenttype", {}).get("label", "") if entry.get("im_contenttype") else ""
+                    "price": _label(entry, "im_price"),
+                    "content_type": _label(entry, "im_contenttype")
                 }
-                
+
                 record = RawAppRecord(
                     category=category,  # Use requested category from URL filter
                     country=country,
                     chart=chart,
                     rank=rank,
                     app_id=app_id,
-                    name=entry.get("title", ""),
+                    name=title,
                     rss_url=rss_url,
                     fetched_at=fetched_at,
                     raw_data=raw_data
@@ -254,21 +532,11 @@ class RSSFetcher:
         """
         if not app_url:
             return None
-        
-        import re
-        
-        # Try different URL patterns
-        patterns = [
-            r'/id(\d+)',  # Standard: /id123456789
-            r'app-id=(\d+)',  # iTunes format: app-id=123456789
-            r'id(\d+)',  # Loose match: id123456789
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, app_url)
-            if match:
-                return match.group(1)
-        
+
+        match = APP_ID_PATTERN_STRICT.search(app_url) or APP_ID_PATTERN_LOOSE.search(app_url)
+        if match:
+            return match.group(1)
+
         return None
     
     def collect_category(
@@ -303,37 +571,77 @@ class RSSFetcher:
             logger.error(f"Error collecting {category}/{country}/{chart}: {e}")
             return []
     
+    def _collect_country(self, country: str, config: CollectConfig) -> List[RawAppRecord]:
+        """Collect all category/chart combinations for a single country.
+
+        Combinations for one country run sequentially so the rate limit
+        delay still applies per host path, even when countries run in
+        parallel.
+
+        Args:
+            country: Country code
+            config: Collection configuration
+
+        Returns:
+            List of RawAppRecord objects for this country
+        """
+        country_records = []
+        combinations = [
+            (category, chart)
+            for category in config.categories
+            for chart in config.charts
+        ]
+
+        for current, (category, chart) in enumerate(combinations, 1):
+            logger.info(
+                f"Collecting {category}/{country}/{chart} "
+                f"({current}/{len(combinations)})"
+            )
+
+            records = self.collect_category(category, country, chart, config.top_n)
+            country_records.extend(records)
+
+            # Additional delay between different requests to be respectful
+            if current < len(combinations):
+                logger.debug(f"Waiting {self.rate_limit_delay} seconds before next combination")
+                time.sleep(self.rate_limit_delay)
+
+        return country_records
+
     def collect_all(self, config: CollectConfig) -> List[RawAppRecord]:
         """Collect apps for all configured categories, countries, and charts.
-        
+
+        Countries are collected in parallel (one worker per country) while
+        each worker walks its own category/chart combinations sequentially,
+        so wall time drops without increasing the request rate per feed.
+
         Args:
             config: Collection configuration
-            
+
         Returns:
             List of all collected RawAppRecord objects
         """
-        all_records = []
         total_combinations = len(config.categories) * len(config.countries) * len(config.charts)
-        current = 0
-        
         logger.info(f"Starting collection for {total_combinations} combinations")
-        
-        for category in config.categories:
+
+        # Nothing to collect; ThreadPoolExecutor rejects max_workers=0
+        if not config.countries:
+            logger.info("Collection complete. Total records: 0")
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(config.countries)) as executor:
+            futures = {
+                country: executor.submit(self._collect_country, country, config)
+                for country in config.countries
+            }
+
+            # Preserve the configured country order in the combined output
+            all_records = []
             for country in config.countries:
-                for chart in config.charts:
-                    current += 1
-                    logger.info(
-                        f"Collecting {category}/{country}/{chart} "
-                        f"({current}/{total_combinations})"
-                    )
-                    
-                    records = self.collect_category(category, country, chart, config.top_n)
-                    all_records.extend(records)
-                    
-                    # Additional delay between different requests to be respectful
-                    if current < total_combinations:
-                        logger.debug(f"Waiting {self.rate_limit_delay} seconds before next combination")
-                        time.sleep(self.rate_limit_delay)
-        
+                try:
+                    all_records.extend(futures[country].result())
+                except Exception as e:
+                    logger.error(f"Collection failed for country {country}: {e}")
+
         logger.info(f"Collection complete. Total records: {len(all_records)}")
         return all_records
\ No newline at end of file
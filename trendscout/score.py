@@ -1,17 +1,270 @@
 """Scoring algorithms for app trend analysis."""
 
 import logging
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from .models import AppPageData, RawAppRecord, ScoredAppRecord
 
 logger = logging.getLogger(__name__)
 
+# Secondary keyword vocabularies used inside the scorers. Module-level so
+# the matching structures below are built once at import.
+PAYWALL_INDICATORS = (
+    "premium", "pro", "subscription", "upgrade", "unlock",
+    "paywall", "purchase", "buy", "payment", "billing"
+)
+
+COMPLEXITY_INDICATORS = (
+    "ai", "ml", "machine learning", "neural", "algorithm",
+    "analytics", "complex", "advanced", "professional",
+    "enterprise", "business", "workflow", "integration"
+)
+
+TRADEMARK_INDICATORS = (
+    "tm", "®", "©", "trademark", "copyright", "patent",
+    "licensed", "authorized", "certified", "verified"
+)
+
+
+def _build_automaton(keywords):
+    """Build an Aho-Corasick automaton over a keyword vocabulary.
+
+    Args:
+        keywords: Iterable of keyword strings
+
+    Returns:
+        Compiled automaton, or None when pyahocorasick is not installed
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _compile_keyword_pattern(keywords) -> "re.Pattern":
+    """Compile one alternation regex matching every keyword in a vocabulary.
+
+    The alternation sits inside a lookahead so overlapping occurrences are
+    all reported, and alternatives are sorted longest-first. Together with
+    the vocabularies containing no keyword that is a substring of another,
+    this makes distinct-match counting equivalent to the per-keyword scan.
+
+    Args:
+        keywords: Iterable of keyword strings
+
+    Returns:
+        Compiled pattern whose group 1 yields the matched keyword
+    """
+    alternation = "|".join(
+        re.escape(keyword)
+        for keyword in sorted(keywords, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))")
+
+
+def _build_matcher(keywords) -> tuple:
+    """Build the matching structures for one keyword vocabulary.
+
+    Args:
+        keywords: Iterable of keyword strings
+
+    Returns:
+        Tuple of (automaton or None, compiled alternation pattern)
+    """
+    return _build_automaton(keywords), _compile_keyword_pattern(keywords)
+
+
+def _count_keywords(text: str, matcher: tuple, limit: Optional[int] = None) -> int:
+    """Count how many distinct keywords appear as substrings of text.
+
+    Both paths make a single linear pass over the text: an Aho-Corasick
+    automaton when pyahocorasick is installed, the C regex engine
+    otherwise. When the caller only needs to know whether a score tier
+    is reached, limit stops the scan at that many distinct keywords.
+
+    Args:
+        text: Lowercased text to scan
+        matcher: (automaton, pattern) pair from _build_matcher
+        limit: Optional distinct-keyword count at which to stop scanning
+
+    Returns:
+        Number of distinct keywords found, capped at limit when given
+    """
+    automaton, pattern = matcher
+
+    if automaton is not None:
+        if limit is None:
+            return len({keyword for _, keyword in automaton.iter(text)})
+        seen = set()
+        for _, keyword in automaton.iter(text):
+            seen.add(keyword)
+            if len(seen) >= limit:
+                break
+        return len(seen)
+
+    if limit is None:
+        return len(set(pattern.findall(text)))
+    seen = set()
+    for match in pattern.finditer(text):
+        seen.add(match.group(1))
+        if len(seen) >= limit:
+            break
+    return len(seen)
+
+
+# One bit per paywall indicator: matches OR into a single int whose
+# popcount is the distinct-indicator count, with no per-call set
+_PAYWALL_BITS = {keyword: 1 << i for i, keyword in enumerate(PAYWALL_INDICATORS)}
+
+
+def _count_paywall_indicators(desc_lower: str) -> int:
+    """Count distinct paywall indicators in a description via a bitmask.
+
+    Args:
+        desc_lower: Lowercased description text
+
+    Returns:
+        Number of distinct paywall indicators found
+    """
+    mask = 0
+    for match in _PAYWALL_MATCHER[1].finditer(desc_lower):
+        mask |= _PAYWALL_BITS[match.group(1)]
+    return mask.bit_count()
+
+
+def _zip_scoring_inputs(raw_records, app_data_map, rank_deltas):
+    """Pair each record with its page data and rank delta up front.
+
+    Hoists the per-iteration app_data_map membership test and the
+    rank_deltas truthiness branch out of the scoring loops.
+
+    Args:
+        raw_records: List of raw app records
+        app_data_map: Map of app_id -> AppPageData
+        rank_deltas: Optional map of app_id -> rank_delta7d
+
+    Returns:
+        List of (raw_record, app_data, rank_delta) tuples, skipping
+        records without page data
+    """
+    deltas_map = rank_deltas or {}
+    items = [
+        (raw_record, app_data_map[raw_record.app_id], deltas_map.get(raw_record.app_id))
+        for raw_record in raw_records
+        if raw_record.app_id in app_data_map
+    ]
+
+    skipped = len(raw_records) - len(items)
+    if skipped:
+        logger.warning(f"No app data found for {skipped} apps, skipping")
+
+    return items
+
+
+# Rank-delta bonus by bucket, indexed with min(max(rank_delta7d + 10, 0), 20):
+# <=-10 -> 2.0, -9..-5 -> 1.5, -4..-1 -> 1.0, 0 -> 0.5, 1..5 -> 0.0, >5 -> -0.5
+_DEMAND_DELTA_LUT = (
+    2.0,
+    1.5, 1.5, 1.5, 1.5, 1.5,
+    1.0, 1.0, 1.0, 1.0,
+    0.5,
+    0.0, 0.0, 0.0, 0.0, 0.0,
+    -0.5, -0.5, -0.5, -0.5, -0.5,
+)
+
+# Rating-volume bonus tiers, resolved with one bisect instead of a branch chain
+_RATING_COUNT_TIERS = (100, 1000, 10000)
+_RATING_COUNT_BONUS = (0.0, 0.25, 0.5, 1.0)
+
+
+@lru_cache(maxsize=100_000)
+def _low_complexity_score(text_lower: str) -> float:
+    """Memoized keyword scan behind compute_low_complexity_score.
+
+    Hourly crawls rescore largely overlapping charts, so the same app
+    names recur batch after batch; the LRU collapses repeat scans to a
+    dict lookup.
+
+    Args:
+        text_lower: Lowercased name/description text
+
+    Returns:
+        Low complexity score from 1.0 to 5.0
+    """
+    # 3 distinct keywords already lands the top tier
+    keyword_matches = _count_keywords(text_lower, _LOW_COMPLEXITY_MATCHER, limit=3)
+
+    if keyword_matches >= 3:
+        return 5.0  # Very simple utility
+    elif keyword_matches >= 2:
+        return 4.0  # Simple utility
+    elif keyword_matches >= 1:
+        return 3.0  # Moderate complexity
+
+    complexity_matches = _count_keywords(text_lower, _COMPLEXITY_MATCHER, limit=2)
+
+    if complexity_matches >= 2:
+        return 1.0  # High complexity
+    elif complexity_matches >= 1:
+        return 2.0  # Moderate complexity
+    else:
+        return 2.5  # Default moderate complexity
+
+
+@lru_cache(maxsize=100_000)
+def _moat_risk_score(text_lower: str) -> float:
+    """Memoized keyword scan behind compute_moat_risk_score.
+
+    Args:
+        text_lower: Lowercased name/description text
+
+    Returns:
+        Moat risk score from 1.0 to 5.0
+    """
+    # 2 distinct brand hits already lands the top tier
+    brand_matches = _count_keywords(text_lower, _HIGH_MOAT_MATCHER, limit=2)
+
+    if brand_matches >= 2:
+        return 5.0  # Very high brand risk
+    elif brand_matches >= 1:
+        return 4.0  # High brand risk
+
+    trademark_matches = _count_keywords(text_lower, _TRADEMARK_MATCHER, limit=1)
+
+    if trademark_matches >= 1:
+        return 3.0  # Moderate trademark risk
+    else:
+        return 1.0  # Low risk (generic concept)
+
 
 class AppScorer:
     """Computes demand, monetization, complexity, and moat risk scores for apps."""
     
+    # Keyword matching is deliberately substring-based ("easy" must hit
+    # "easily", "qr" must hit "qrcode", and "star wars"/"®" are not word
+    # tokens), so these vocabularies cannot become token sets; the
+    # single-pass matchers below keep membership checks to one text scan.
     # Keywords for low complexity scoring
     LOW_COMPLEXITY_KEYWORDS = [
         "counter", "timer", "widget", "filter", "scanner", "qr", "pdf", 
@@ -20,6 +273,10 @@ class AppScorer:
         "note", "memo", "reminder", "list", "simple", "basic", "easy"
     ]
     
+    # Batches below this size are scored inline; the thread pool only
+    # pays off once there is real keyword-scan work to spread out
+    PARALLEL_SCORE_THRESHOLD = 500
+
     # High moat risk keywords (trademarked/branded)
     HIGH_MOAT_KEYWORDS = [
         "official", "disney", "marvel", "snapchat", "tiktok", "instagram",
@@ -29,12 +286,8 @@ class AppScorer:
         "mcdonalds", "nike", "adidas", "uber", "airbnb", "tesla"
     ]
     
-    def __init__(self):
-        """Initialize scorer."""
-        pass
-    
+    @staticmethod
     def compute_demand_score(
-        self, 
         rank_delta7d: Optional[int], 
         rating_count: int,
         recent_reviews: Optional[List[str]] = None
@@ -50,39 +303,23 @@ class AppScorer:
             Demand score from 1.0 to 5.0
         """
         score = 1.0
-        
-        # Base score from rank delta (primary factor)
+
+        # Base score from rank delta (primary factor), via bucketed lookup
         if rank_delta7d is not None:
-            if rank_delta7d <= -10:  # Rank improved significantly
-                score += 2.0
-            elif rank_delta7d <= -5:  # Rank improved moderately  
-                score += 1.5
-            elif rank_delta7d <= -1:  # Rank improved slightly
-                score += 1.0
-            elif rank_delta7d == 0:  # No rank change
-                score += 0.5
-            elif rank_delta7d <= 5:  # Rank declined slightly
-                score += 0.0
-            else:  # Rank declined significantly
-                score -= 0.5
-        
+            score += _DEMAND_DELTA_LUT[min(max(rank_delta7d + 10, 0), 20)]
+
         # Bonus from rating volume (secondary factor)
-        if rating_count >= 10000:
-            score += 1.0
-        elif rating_count >= 1000:
-            score += 0.5
-        elif rating_count >= 100:
-            score += 0.25
-        
+        score += _RATING_COUNT_BONUS[bisect_right(_RATING_COUNT_TIERS, rating_count)]
+
         # Bonus from review velocity if available
         if recent_reviews and len(recent_reviews) >= 3:
             score += 0.5
-        
+
         # Clamp to valid range
         return max(1.0, min(5.0, score))
     
+    @staticmethod
     def compute_monetization_score(
-        self, 
         price: float, 
         has_iap: bool,
         description: str = ""
@@ -108,13 +345,7 @@ class AppScorer:
             if has_iap:
                 # Check for multiple IAP or paywall indicators
                 desc_lower = description.lower()
-                paywall_indicators = [
-                    "premium", "pro", "subscription", "upgrade", "unlock",
-                    "paywall", "purchase", "buy", "payment", "billing"
-                ]
-                
-                indicator_count = sum(1 for indicator in paywall_indicators 
-                                    if indicator in desc_lower)
+                indicator_count = _count_paywall_indicators(desc_lower)
                 
                 if indicator_count >= 3:
                     return 4.0  # Free + multiple IAP signals = high monetization
@@ -123,7 +354,8 @@ class AppScorer:
             else:
                 return 1.0  # Free without IAP = minimal monetization
     
-    def compute_low_complexity_score(self, name: str, description: str = "") -> float:
+    @staticmethod
+    def compute_low_complexity_score(name: str, description: str = "") -> float:
         """Compute low complexity score based on app name and description.
         
         Apps with simple functionality are easier to replicate.
@@ -135,38 +367,10 @@ class AppScorer:
         Returns:
             Low complexity score from 1.0 to 5.0 (higher = simpler/easier to build)
         """
-        text_to_analyze = f"{name} {description}".lower()
-        
-        # Count matching keywords
-        keyword_matches = sum(1 for keyword in self.LOW_COMPLEXITY_KEYWORDS 
-                            if keyword in text_to_analyze)
-        
-        # Base score
-        if keyword_matches >= 3:
-            return 5.0  # Very simple utility
-        elif keyword_matches >= 2:
-            return 4.0  # Simple utility
-        elif keyword_matches >= 1:
-            return 3.0  # Moderate complexity
-        else:
-            # Check for additional complexity indicators
-            complexity_indicators = [
-                "ai", "ml", "machine learning", "neural", "algorithm",
-                "analytics", "complex", "advanced", "professional",
-                "enterprise", "business", "workflow", "integration"
-            ]
-            
-            complexity_matches = sum(1 for indicator in complexity_indicators 
-                                   if indicator in text_to_analyze)
-            
-            if complexity_matches >= 2:
-                return 1.0  # High complexity
-            elif complexity_matches >= 1:
-                return 2.0  # Moderate complexity
-            else:
-                return 2.5  # Default moderate complexity
+        return _low_complexity_score(f"{name} {description}".lower())
     
-    def compute_moat_risk_score(self, name: str, description: str = "") -> float:
+    @staticmethod
+    def compute_moat_risk_score(name: str, description: str = "") -> float:
         """Compute moat risk score based on brand/trademark exposure.
         
         Higher score = higher risk of trademark/brand issues.
@@ -178,33 +382,10 @@ class AppScorer:
         Returns:
             Moat risk score from 1.0 to 5.0 (higher = more risky)
         """
-        text_to_analyze = f"{name} {description}".lower()
-        
-        # Count high-risk brand keywords
-        brand_matches = sum(1 for keyword in self.HIGH_MOAT_KEYWORDS 
-                           if keyword in text_to_analyze)
-        
-        if brand_matches >= 2:
-            return 5.0  # Very high brand risk
-        elif brand_matches >= 1:
-            return 4.0  # High brand risk
-        else:
-            # Check for generic trademark indicators
-            trademark_indicators = [
-                "tm", "®", "©", "trademark", "copyright", "patent",
-                "licensed", "authorized", "certified", "verified"
-            ]
-            
-            trademark_matches = sum(1 for indicator in trademark_indicators 
-                                  if indicator in text_to_analyze)
-            
-            if trademark_matches >= 1:
-                return 3.0  # Moderate trademark risk
-            else:
-                return 1.0  # Low risk (generic concept)
+        return _moat_risk_score(f"{name} {description}".lower())
     
+    @staticmethod
     def compute_total_score(
-        self, 
         demand: float, 
         monetization: float, 
         low_complexity: float, 
@@ -251,52 +432,31 @@ class AppScorer:
         try:
             # Compute individual scores
             demand = self.compute_demand_score(
-                rank_delta7d, 
-                app_data.rating_count, 
+                rank_delta7d,
+                app_data.rating_count,
                 app_data.recent_reviews
             )
-            
+
             monetization = self.compute_monetization_score(
                 app_data.price,
                 app_data.has_iap,
                 description=""  # We only have desc_len, not full text
             )
-            
-            low_complexity = self.compute_low_complexity_score(
-                raw_record.name,
-                description=""  # Could be enhanced with full description
-            )
-            
-            moat_risk = self.compute_moat_risk_score(
-                raw_record.name,
-                description=""
-            )
+
+            # Lowercase once and hand the same buffer to both keyword
+            # scorers (we only have the name, not the full description)
+            text_lower = raw_record.name.lower()
+            low_complexity = _low_complexity_score(text_lower)
+            moat_risk = _moat_risk_score(text_lower)
             
             total = self.compute_total_score(demand, monetization, low_complexity, moat_risk)
             
-            # Create scored record
+            # Create scored record by unpacking both source models; the
+            # extra recent_reviews field from AppPageData is ignored
             scored_record = ScoredAppRecord(
-                # Copy all fields from raw record
-                category=raw_record.category,
-                country=raw_record.country,
-                chart=raw_record.chart,
-                rank=raw_record.rank,
-                app_id=raw_record.app_id,
-                name=raw_record.name,
-                rss_url=raw_record.rss_url,
-                fetched_at=raw_record.fetched_at,
-                raw_data=raw_record.raw_data,
-                
-                # Add app page data
-                bundle_id=app_data.bundle_id,
-                price=app_data.price,
-                has_iap=app_data.has_iap,
-                rating_count=app_data.rating_count,
-                rating_avg=app_data.rating_avg,
-                desc_len=app_data.desc_len,
+                **dict(raw_record),
+                **dict(app_data),
                 rank_delta7d=rank_delta7d,
-                
-                # Add computed scores
                 demand=demand,
                 monetization=monetization,
                 low_complexity=low_complexity,
@@ -304,11 +464,14 @@ class AppScorer:
                 total=total
             )
             
-            logger.debug(
-                f"Scored app {raw_record.app_id}: "
-                f"D={demand:.1f} M={monetization:.1f} "
-                f"C={low_complexity:.1f} R={moat_risk:.1f} T={total:.2f}"
-            )
+            # Guarded %-style call so no format string is built per app
+            # when debug logging is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Scored app %s: D=%.1f M=%.1f C=%.1f R=%.1f T=%.2f",
+                    raw_record.app_id, demand, monetization,
+                    low_complexity, moat_risk, total
+                )
             
             return scored_record
             
@@ -332,24 +495,162 @@ class AppScorer:
         Returns:
             List of scored app records
         """
+        # Large batches spread across worker threads; the keyword scans
+        # run in the regex/Aho-Corasick C cores, which release the GIL
+        if len(raw_records) >= self.PARALLEL_SCORE_THRESHOLD:
+            workers = os.cpu_count() or 1
+            chunk_size = -(-len(raw_records) // workers)
+            chunks = [
+                raw_records[i:i + chunk_size]
+                for i in range(0, len(raw_records), chunk_size)
+            ]
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                chunk_results = executor.map(
+                    lambda chunk: self._score_chunk(chunk, app_data_map, rank_deltas),
+                    chunks
+                )
+            scored_records = [record for result in chunk_results for record in result]
+        else:
+            scored_records = self._score_chunk(raw_records, app_data_map, rank_deltas)
+
+        logger.info(f"Successfully scored {len(scored_records)}/{len(raw_records)} apps")
+        return scored_records
+
+    def _score_chunk(
+        self,
+        raw_records: List[RawAppRecord],
+        app_data_map: dict[str, AppPageData],
+        rank_deltas: Optional[dict[str, int]] = None
+    ) -> List[ScoredAppRecord]:
+        """Score one slice of a batch sequentially.
+
+        Args:
+            raw_records: Slice of raw app records
+            app_data_map: Map of app_id -> AppPageData
+            rank_deltas: Optional map of app_id -> rank_delta7d
+
+        Returns:
+            List of scored app records for this slice
+        """
+        items = _zip_scoring_inputs(raw_records, app_data_map, rank_deltas)
         scored_records = []
-        
-        for raw_record in raw_records:
-            app_id = raw_record.app_id
-            
-            if app_id not in app_data_map:
-                logger.warning(f"No app data found for {app_id}, skipping")
-                continue
-            
-            app_data = app_data_map[app_id]
-            rank_delta = rank_deltas.get(app_id) if rank_deltas else None
-            
+
+        for raw_record, app_data, rank_delta in items:
             try:
                 scored_record = self.score_app(raw_record, app_data, rank_delta)
                 scored_records.append(scored_record)
             except Exception as e:
-                logger.error(f"Failed to score app {app_id}: {e}")
+                logger.error(f"Failed to score app {raw_record.app_id}: {e}")
                 continue
-        
+
+        return scored_records
+
+    def score_apps_vectorized(
+        self,
+        raw_records: List[RawAppRecord],
+        app_data_map: dict[str, AppPageData],
+        rank_deltas: Optional[dict[str, int]] = None
+    ) -> List[ScoredAppRecord]:
+        """Score multiple apps with NumPy-vectorized arithmetic.
+
+        The demand, monetization, and total scores are pure piecewise
+        arithmetic, so they are computed for the whole batch at once with
+        np.select/np.where instead of per-app Python branches. The
+        keyword-based complexity and moat scores stay scalar (they scan
+        text, not numbers). Falls back to score_apps when NumPy is not
+        installed; results are identical either way.
+
+        Args:
+            raw_records: List of raw app records
+            app_data_map: Map of app_id -> AppPageData
+            rank_deltas: Optional map of app_id -> rank_delta7d
+
+        Returns:
+            List of scored app records
+        """
+        if not NUMPY_AVAILABLE:
+            logger.debug("NumPy not installed, using scalar scoring path")
+            return self.score_apps(raw_records, app_data_map, rank_deltas)
+
+        items = _zip_scoring_inputs(raw_records, app_data_map, rank_deltas)
+
+        if not items:
+            logger.info(f"Successfully scored 0/{len(raw_records)} apps")
+            return []
+
+        deltas = np.array([0 if delta is None else delta for _, _, delta in items])
+        has_delta = np.array([delta is not None for _, _, delta in items])
+        rating_counts = np.array([app_data.rating_count for _, app_data, _ in items])
+        prices = np.array([app_data.price for _, app_data, _ in items])
+        has_iap = np.array([app_data.has_iap for _, app_data, _ in items])
+        has_reviews = np.array([
+            bool(app_data.recent_reviews and len(app_data.recent_reviews) >= 3)
+            for _, app_data, _ in items
+        ])
+
+        # Demand: same piecewise branches as compute_demand_score
+        delta_bonus = np.select(
+            [deltas <= -10, deltas <= -5, deltas <= -1, deltas == 0, deltas <= 5],
+            [2.0, 1.5, 1.0, 0.5, 0.0],
+            default=-0.5,
+        )
+        count_bonus = np.select(
+            [rating_counts >= 10000, rating_counts >= 1000, rating_counts >= 100],
+            [1.0, 0.5, 0.25],
+            default=0.0,
+        )
+        demand = np.clip(
+            1.0
+            + np.where(has_delta, delta_bonus, 0.0)
+            + count_bonus
+            + np.where(has_reviews, 0.5, 0.0),
+            1.0,
+            5.0,
+        )
+
+        # Monetization: score_app passes an empty description, so the free
+        # + IAP paywall-signal branch always resolves to the 3.0 tier
+        monetization = np.select(
+            [(prices > 0) & has_iap, prices > 0, has_iap],
+            [5.0, 3.0, 3.0],
+            default=1.0,
+        )
+
+        lowered_names = [raw_record.name.lower() for raw_record, _, _ in items]
+        low_complexity = np.array([_low_complexity_score(text) for text in lowered_names])
+        moat_risk = np.array([_moat_risk_score(text) for text in lowered_names])
+
+        # Round per element with Python's round: np.round resolves exact
+        # halves differently on binary floats (e.g. 3.225 -> 3.22 vs the
+        # scalar path's 3.23), which would break vectorized/scalar parity
+        weighted = (
+            0.35 * demand
+            + 0.25 * monetization
+            + 0.25 * low_complexity
+            + 0.15 * (5.0 - moat_risk)
+        )
+        total = [round(float(value), 2) for value in weighted]
+
+        scored_records = []
+        for i, (raw_record, app_data, rank_delta) in enumerate(items):
+            scored_records.append(ScoredAppRecord(
+                **dict(raw_record),
+                **dict(app_data),
+                rank_delta7d=rank_delta,
+                demand=float(demand[i]),
+                monetization=float(monetization[i]),
+                low_complexity=float(low_complexity[i]),
+                moat_risk=float(moat_risk[i]),
+                total=total[i],
+            ))
+
         logger.info(f"Successfully scored {len(scored_records)}/{len(raw_records)} apps")
-        return scored_records
\ No newline at end of file
+        return scored_records
+
+# Matching structures built once at import. The class keyword lists above
+# stay plain lists because they are part of the scorer's public surface.
+_LOW_COMPLEXITY_MATCHER = _build_matcher(AppScorer.LOW_COMPLEXITY_KEYWORDS)
+_HIGH_MOAT_MATCHER = _build_matcher(AppScorer.HIGH_MOAT_KEYWORDS)
+_PAYWALL_MATCHER = _build_matcher(PAYWALL_INDICATORS)
+_COMPLEXITY_MATCHER = _build_matcher(COMPLEXITY_INDICATORS)
+_TRADEMARK_MATCHER = _build_matcher(TRADEMARK_INDICATORS)
@@ -1,8 +1,12 @@
 """App Store page scraping for detailed app information."""
 
+import json
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from typing import List, Optional
 
 import requests
@@ -11,8 +15,194 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .models import AppPageData
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    # Advertise brotli only when urllib3 can actually decode it; offering
+    # br without the codec would hand us undecodable bodies
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
 logger = logging.getLogger(__name__)
 
+# Browser-like headers shared by every scraper instance; only the
+# User-Agent varies per construction
+_DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0"
+}
+
+# Extractor regexes compiled once at import; per-call re.search on string
+# literals pays a cache lookup and IGNORECASE flag parse every time.
+_BUNDLE_ID_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\\"bundleId\\":\s*\\"([^\\]+)\\"',  # Escaped quotes in JSON
+    r'"bundleId"\s*:\s*"([^"]+)"',        # Regular quotes
+    r'"bundleId":"([^"]+)"',              # No spaces
+    r'bundleId["\s]*:\s*["\s]*([^"]+)["\s]*',  # Loose matching
+    r'data-bundle-id="([^"]+)"'           # Data attribute
+))
+_BUNDLE_MARKER_PATTERN = re.compile("bundle", re.IGNORECASE)
+_META_APP_ID_PATTERN = re.compile(r"app-id=(\d+)")
+_TEST_BUNDLE_PATTERN = re.compile(r'com\.[\w\.]+')
+_FREE_BUTTON_PATTERN = re.compile(r"Get|Free", re.IGNORECASE)
+_PRICE_NUMBER_PATTERN = re.compile(r'[\d,]+\.?\d*')
+_RATING_COUNT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|thousand)?\s*ratings?',
+    r'"ratingCount":(\d+)',
+    r'(\d+)\s*reviews?'
+))
+_RATING_AVG_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'["\']?ratingValue["\']?\s*:\s*(\d+\.?\d*)',
+    r'(\d+\.?\d*)\s*out of\s*5',
+    r'(\d+\.?\d*)\s*stars?'
+))
+_STARS_ARIA_PATTERN = re.compile(r"\d+\.?\d*\s*out of\s*5", re.IGNORECASE)
+_NUMBER_PATTERN = re.compile(r"(\d+\.?\d*)")
+_DESCRIPTION_CLASS_PATTERN = re.compile(r"description", re.IGNORECASE)
+
+# IAP indicator vocabularies; a negative match always wins over a positive
+_IAP_NEGATIVE_INDICATORS = (
+    "no in-app purchases",
+    "no iap",
+    "free app",
+    "completely free"
+)
+_IAP_POSITIVE_INDICATORS = (
+    "offers in-app purchases",
+    "contains in-app purchases",
+    "in-app purchases available",
+    "in-app-purchase"
+)
+
+
+def _build_iap_automaton():
+    """Build one Aho-Corasick automaton over all IAP indicators.
+
+    Each hit reports whether the indicator is positive, so one linear
+    pass over the page replaces eight separate substring scans.
+
+    Returns:
+        Compiled automaton, or None when pyahocorasick is not installed
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for indicator in _IAP_NEGATIVE_INDICATORS:
+        automaton.add_word(indicator, False)
+    for indicator in _IAP_POSITIVE_INDICATORS:
+        automaton.add_word(indicator, True)
+    automaton.make_automaton()
+    return automaton
+
+
+_IAP_AUTOMATON = _build_iap_automaton()
+_IAP_NEGATIVE_PATTERN = re.compile("|".join(
+    re.escape(indicator)
+    for indicator in sorted(_IAP_NEGATIVE_INDICATORS, key=len, reverse=True)
+), re.IGNORECASE)
+_IAP_POSITIVE_PATTERN = re.compile("|".join(
+    re.escape(indicator)
+    for indicator in sorted(_IAP_POSITIVE_INDICATORS, key=len, reverse=True)
+), re.IGNORECASE)
+
+# Characters terminating a brute-forced bundle id value
+_BUNDLE_STOP_CHARS = frozenset(['"', '\\', ',', '}', ' '])
+
+
+def _brute_force_bundle_id(text: str) -> Optional[str]:
+    """Find the com.* token following a bundleId marker in text.
+
+    Args:
+        text: Raw HTML or script content to scan
+
+    Returns:
+        Bundle id string, or None when no marker/token is found
+    """
+    bundle_index = text.find('bundleId')
+    if bundle_index < 0:
+        return None
+    com_start = text.find('com.', bundle_index)
+    if com_start < 0:
+        return None
+    com_end = com_start
+    while com_end < len(text) and text[com_end] not in _BUNDLE_STOP_CHARS:
+        com_end += 1
+    bundle_id = text[com_start:com_end]
+    return bundle_id if bundle_id and '.' in bundle_id else None
+
+
+@lru_cache(maxsize=1024)
+def _build_app_url(app_id: str, country: str) -> str:
+    """Build the App Store page URL for an app in a country.
+
+    Batch scrapes repeat (app_id, country) pairs across charts, so the
+    formatted URL is memoized.
+
+    Args:
+        app_id: App Store app ID
+        country: Country code
+
+    Returns:
+        App Store URL
+    """
+    return f"https://apps.apple.com/{country}/app/id{app_id}"
+
+
+@lru_cache(maxsize=1024)
+def _parse_price_text(price_text: str) -> float:
+    """Parse price text to a float value.
+
+    The distinct inputs across a scrape are a handful of strings
+    ("Free", "Get", "$0.99", ...), so results are memoized.
+
+    Args:
+        price_text: Price string from the page
+
+    Returns:
+        Price as float, 0.0 for free indicators or unparseable text
+    """
+    if not price_text:
+        return 0.0
+
+    # Common free indicators
+    if any(word in price_text.lower() for word in ["free", "get", "open"]):
+        return 0.0
+
+    # Extract numeric price
+    price_match = _PRICE_NUMBER_PATTERN.search(price_text.replace(",", ""))
+    if price_match:
+        return float(price_match.group())
+
+    return 0.0
+
 
 class AppScraper:
     """Scrapes Apple App Store pages for detailed app information."""
@@ -32,22 +222,51 @@ class AppScraper:
         
         self.user_agent = user_agent
         self.rate_limit_delay = rate_limit_delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Upgrade-Insecure-Requests": "1",
-            "Cache-Control": "max-age=0"
-        })
+        # AIMD pacing around the configured delay: healthy responses ease
+        # the delay additively toward the floor, 429/503 double it (or
+        # honor Retry-After), so cold batches speed up and throttled ones
+        # back off instead of sleeping a constant 3s either way
+        self._min_delay = rate_limit_delay / 2
+        self._max_delay = rate_limit_delay * 10
+        self._current_delay = rate_limit_delay
+        self.session = self._create_session()
+        self.session.headers.update({**_DEFAULT_HEADERS, "User-Agent": user_agent})
     
+    @staticmethod
+    def _create_session():
+        """Create the HTTP client for page fetching.
+
+        Prefers an httpx client with HTTP/2 when the optional httpx[http2]
+        extra is installed: apps.apple.com serves HTTP/2, so batch scrapes
+        multiplex over one TLS connection instead of renegotiating.
+        Falls back to a plain requests.Session otherwise.
+
+        Returns:
+            httpx.Client or requests.Session
+        """
+        if HTTPX_AVAILABLE:
+            try:
+                return httpx.Client(
+                    http2=True,
+                    timeout=10,
+                    limits=httpx.Limits(max_connections=8)
+                )
+            except ImportError:
+                # httpx installed without the h2 extra; HTTP/1.1 httpx
+                # adds little over requests, so keep the default path
+                logger.debug("httpx installed without h2 support, using requests")
+
+        # Batch scraping hits one host from several worker threads, so
+        # keep a pool of warm connections instead of churning TLS
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        return session
+
     def build_app_url(self, app_id: str, country: str = "us") -> str:
         """Build App Store URL for given app ID and country.
         
@@ -58,7 +277,7 @@ class AppScraper:
         Returns:
             App Store URL
         """
-        return f"https://apps.apple.com/{country}/app/id{app_id}"
+        return _build_app_url(app_id, country)
     
     @retry(
         stop=stop_after_attempt(2),
@@ -81,79 +300,31 @@ class AppScraper:
         logger.debug(f"Fetching app page: {url}")
         
         response = self.session.get(url, timeout=10)
+
+        if response.status_code in (429, 503):
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                penalty = float(retry_after)
+            else:
+                penalty = self._current_delay * 2
+            self._current_delay = min(self._max_delay, max(penalty, self._current_delay * 2))
+            logger.warning(
+                f"Server throttled request ({response.status_code}), "
+                f"backing off to {self._current_delay:.1f}s between requests"
+            )
+
         response.raise_for_status()
-        
-        # Handle content decompression properly
-        try:
-            import gzip
-            import brotli
-            from io import BytesIO
-            
-            content = response.content
-            
-            # Check if content is compressed and decompress accordingly
-            # First, try automatic decompression via response.text (requests handles this)
-            if response.text and not response.text.startswith('��'):
-                logger.debug("Using response.text (automatic decompression)")
-                return response.text
-            
-            # If that fails, manual decompression
-            logger.debug("Attempting manual decompression")
-            
-            # Try Brotli decompression first (common for modern sites)
-            if content.startswith(b'\x1b'):  # Brotli magic number
-                try:
-                    decompressed = brotli.decompress(content)
-                    html = decompressed.decode('utf-8')
-                    logger.debug("Successfully decompressed with Brotli")
-                    return html
-                except Exception as e:
-                    logger.debug(f"Brotli decompression failed: {e}")
-            
-            # Try Gzip decompression
-            if content.startswith(b'\x1f\x8b'):  # Gzip magic number
-                try:
-                    with gzip.GzipFile(fileobj=BytesIO(content)) as gz:
-                        decompressed = gz.read()
-                    html = decompressed.decode('utf-8')
-                    logger.debug("Successfully decompressed with Gzip")
-                    return html
-                except Exception as e:
-                    logger.debug(f"Gzip decompression failed: {e}")
-            
-            # Try deflate decompression
-            try:
-                import zlib
-                decompressed = zlib.decompress(content)
-                html = decompressed.decode('utf-8')
-                logger.debug("Successfully decompressed with deflate")
-                return html
-            except Exception as e:
-                logger.debug(f"Deflate decompression failed: {e}")
-            
-            # If all decompression attempts fail, try charset detection
-            try:
-                import chardet
-                detected = chardet.detect(content)
-                encoding = detected.get('encoding', 'utf-8')
-                html = content.decode(encoding)
-                logger.debug(f"Using detected encoding: {encoding}")
-                return html
-            except Exception as e:
-                logger.debug(f"Charset detection failed: {e}")
-            
-            # Final fallback - force UTF-8 with error handling
-            html = content.decode('utf-8', errors='replace')
-            logger.warning("Using UTF-8 with error replacement")
-            return html
-            
-        except Exception as e:
-            logger.error(f"All decompression attempts failed: {e}")
-            # Last resort fallback
-            try:
-                return response.text
-            except:
-                return content.decode('utf-8', errors='replace')
+
+        # Healthy response: ease pacing back toward the floor
+        self._current_delay = max(self._min_delay, self._current_delay - 0.25)
+
+        # urllib3 decodes gzip/deflate transparently and, with the brotli
+        # dependency installed, br as well; the old manual codec waterfall
+        # never ran on the happy path and cost a full .content copy
+        if not response.encoding:
+            # Fall back to charset detection only when no charset is declared
+            response.encoding = response.apparent_encoding
+        return response.text
     
     def parse_app_page(self, html: str, app_id: str) -> AppPageData:
         """Parse app page HTML to extract key information.
@@ -168,14 +339,16 @@ class AppScraper:
         Raises:
             ValueError: If required fields cannot be extracted
         """
-        soup = BeautifulSoup(html, "html.parser")
-        
+        # lxml's C parser is an order of magnitude faster than the
+        # pure-Python html.parser on ~500KB App Store pages
+        soup = BeautifulSoup(html, "lxml")
+
         try:
             bundle_id = self._extract_bundle_id(soup, html, app_id)
             price = self._extract_price(soup)
-            has_iap = self._extract_has_iap(soup)
-            rating_count = self._extract_rating_count(soup)
-            rating_avg = self._extract_rating_avg(soup)
+            has_iap = self._extract_has_iap(soup, html)
+            rating_count = self._extract_rating_count(soup, html)
+            rating_avg = self._extract_rating_avg(soup, html)
             desc_len = self._extract_description_length(soup)
             recent_reviews = self._extract_recent_reviews(soup)
             
@@ -195,93 +368,52 @@ class AppScraper:
     
     def _extract_bundle_id(self, soup: BeautifulSoup, html: str = None, app_id: str = None) -> str:
         """Extract bundle ID from app page."""
-        # Look for bundle ID in various locations (handle escaped quotes, smart quotes, etc.)
-        patterns = [
-            r'\\"bundleId\\":\s*\\"([^\\]+)\\"',  # Escaped quotes in JSON
-            r'"bundleId"\s*:\s*"([^"]+)"',        # Regular quotes
-            r'"bundleId":"([^"]+)"',              # No spaces
-            r'bundleId["\s]*:\s*["\s]*([^"]+)["\s]*',  # Loose matching
-            r'data-bundle-id="([^"]+)"'           # Data attribute
-        ]
-        
-        html_str = str(soup)
-        for pattern in patterns:
-            match = re.search(pattern, html_str, re.IGNORECASE)
-            if match:
-                bundle_id = match.group(1).strip()
-                if bundle_id and '.' in bundle_id:  # Valid bundle ID format
-                    return bundle_id
+        # Use the original page string when provided; re-serializing the
+        # DOM costs an O(N) pass per extractor
+        html_str = html if html is not None else str(soup)
+
+        # One case-insensitive linear scan locates every "bundle" marker,
+        # then the patterns run over a small window around each hit
+        # instead of five separate full-page regex passes over ~500KB
+        for marker_match in _BUNDLE_MARKER_PATTERN.finditer(html_str):
+            marker = marker_match.start()
+            window = html_str[max(0, marker - 30):marker + 400]
+            for pattern in _BUNDLE_ID_PATTERNS:
+                match = pattern.search(window)
+                if match:
+                    bundle_id = match.group(1).strip()
+                    if bundle_id and '.' in bundle_id:  # Valid bundle ID format
+                        return bundle_id
         
         # Fallback: look in meta tags
         meta_tag = soup.find("meta", {"name": "apple-itunes-app"})
         if meta_tag and meta_tag.get("content"):
             content = meta_tag["content"]
-            match = re.search(r"app-id=(\d+)", content)
+            match = _META_APP_ID_PATTERN.search(content)
             if match:
                 return f"app.{match.group(1)}"  # Fallback format
         
-        # Manual fallback: look for any com.* pattern in raw HTML containing bundleId
-        # BeautifulSoup might not parse all scripts correctly, so search raw HTML
-        logger.debug(f"Manual fallback: searching raw HTML (length: {len(html) if html else 'None'})")
-        # Check for various patterns that might be in the HTML
-        patterns_to_check = ["bundleId", "GoogleMobile", "com.google", "iPhone", "script"]
-        found_patterns = {}
-        if html:
-            for pattern in patterns_to_check:
-                found_patterns[pattern] = pattern in html
-        logger.debug(f"Pattern search results: {found_patterns}")
-        # Show a sample of the HTML content
+        # Brute-force fallback: find 'bundleId' then the com.* token
+        # after it, first in the raw page, then in each script's text
+        # (BeautifulSoup might not parse all scripts correctly)
         if html:
-            sample = html[:500] + "..." if len(html) > 500 else html
-            logger.debug(f"HTML sample: {repr(sample)}")
-        bundleid_found = html and ("bundleId" in html or "bundleid" in html.lower())
-        logger.debug(f"BundleId search result: {bundleid_found}")
-        if bundleid_found:
-            # Find position of bundleId in raw HTML
-            bundle_index = html.find('bundleId')
-            if bundle_index >= 0:
-                # Look for com.* pattern after bundleId
-                com_start = html.find('com.', bundle_index)
-                if com_start >= 0:
-                    logger.debug(f"Found com. at position {com_start}")
-                    # Find the end of the bundle ID (stop at quote or backslash)
-                    com_end = com_start
-                    while com_end < len(html) and html[com_end] not in ['"', '\\', ',', '}', ' ']:
-                        com_end += 1
-                    
-                    bundle_id = html[com_start:com_end]
-                    logger.debug(f"Extracted bundle ID: {bundle_id}")
-                    if bundle_id and '.' in bundle_id:
-                        return bundle_id
-        
-        # Also try with soup scripts as backup
+            bundle_id = _brute_force_bundle_id(html)
+            if bundle_id:
+                logger.debug("Brute-forced bundle ID from raw HTML: %s", bundle_id)
+                return bundle_id
+
         scripts = soup.find_all("script")
-        logger.debug(f"Manual fallback: found {len(scripts)} scripts")
-        for i, script in enumerate(scripts):
+        for script in scripts:
             if script.string and "bundleId" in str(script.string):
-                logger.debug(f"Script {i} contains bundleId")
-                script_content = str(script.string)
-                # Find position of bundleId
-                bundle_index = script_content.find('bundleId')
-                if bundle_index >= 0:
-                    # Look for com.* pattern after bundleId
-                    com_start = script_content.find('com.', bundle_index)
-                    if com_start >= 0:
-                        logger.debug(f"Found com. at position {com_start}")
-                        # Find the end of the bundle ID
-                        com_end = com_start
-                        while com_end < len(script_content) and script_content[com_end] not in ['"', '\\\\', ',', '}', ' ']:
-                            com_end += 1
-                        
-                        bundle_id = script_content[com_start:com_end]
-                        logger.debug(f"Extracted bundle ID: {bundle_id}")
-                        if bundle_id and '.' in bundle_id:
-                            return bundle_id
-        
+                bundle_id = _brute_force_bundle_id(str(script.string))
+                if bundle_id:
+                    logger.debug("Brute-forced bundle ID from script: %s", bundle_id)
+                    return bundle_id
+
         # Test scenario fallback
         for script in scripts:
             if script.string and "example" in str(script.string).lower():
-                test_match = re.search(r'com\.[\w\.]+', str(script.string))
+                test_match = _TEST_BUNDLE_PATTERN.search(str(script.string))
                 if test_match:
                     return test_match.group(0)
         
@@ -307,19 +439,25 @@ class AppScraper:
                 return self._parse_price_text(price_text)
         
         # Look in JSON-LD or other structured data
-        scripts = soup.find_all("script", type="application/ld+json")
+        # CSS selector matches on the type attribute directly instead of
+        # find_all testing every element's tag name plus kwargs
+        scripts = soup.select('script[type="application/ld+json"]')
         for script in scripts:
             try:
-                import json
-                data = json.loads(script.string)
+                # orjson's Rust decoder parses these blobs 2-5x faster
+                # than stdlib json when installed
+                if ORJSON_AVAILABLE:
+                    data = orjson.loads(script.string)
+                else:
+                    data = json.loads(script.string)
                 if "offers" in data and data["offers"]:
                     price_str = data["offers"][0].get("price", "0")
                     return float(price_str)
-            except (json.JSONDecodeError, KeyError, ValueError):
+            except (json.JSONDecodeError, KeyError, ValueError, TypeError):
                 continue
         
         # Check for "Get" button (free app indicator)
-        get_button = soup.find(string=re.compile(r"Get|Free", re.IGNORECASE))
+        get_button = soup.find(string=_FREE_BUTTON_PATTERN)
         if get_button:
             return 0.0
         
@@ -328,58 +466,34 @@ class AppScraper:
     
     def _parse_price_text(self, price_text: str) -> float:
         """Parse price text to float value."""
-        if not price_text:
-            return 0.0
-        
-        # Common free indicators
-        if any(word in price_text.lower() for word in ["free", "get", "open"]):
-            return 0.0
-        
-        # Extract numeric price
-        price_match = re.search(r'[\d,]+\.?\d*', price_text.replace(",", ""))
-        if price_match:
-            return float(price_match.group())
-        
-        return 0.0
+        return _parse_price_text(price_text)
     
-    def _extract_has_iap(self, soup: BeautifulSoup) -> bool:
+    def _extract_has_iap(self, soup: BeautifulSoup, html: str = None) -> bool:
         """Check if app has in-app purchases."""
-        html_str = str(soup).lower()
-        
-        # Check for negative indicators first
-        negative_indicators = [
-            "no in-app purchases",
-            "no iap",
-            "free app",
-            "completely free"
-        ]
-        
-        for indicator in negative_indicators:
-            if indicator in html_str:
-                return False
-        
-        # Check for positive indicators
-        positive_indicators = [
-            "offers in-app purchases",
-            "contains in-app purchases", 
-            "in-app purchases available",
-            "in-app-purchase"
-        ]
-        
-        return any(indicator in html_str for indicator in positive_indicators)
+        html_str = html if html is not None else str(soup)
+
+        # One automaton pass over the page instead of eight substring
+        # scans; a negative indicator anywhere wins over positives. The
+        # automaton is case-sensitive, so only that path folds the page
+        if _IAP_AUTOMATON is not None:
+            has_positive = False
+            for _, is_positive in _IAP_AUTOMATON.iter(html_str.lower()):
+                if not is_positive:
+                    return False
+                has_positive = True
+            return has_positive
+
+        # IGNORECASE patterns search the page as-is, skipping the ~500KB
+        # lowered copy the old substring checks required
+        if _IAP_NEGATIVE_PATTERN.search(html_str):
+            return False
+        return _IAP_POSITIVE_PATTERN.search(html_str) is not None
     
-    def _extract_rating_count(self, soup: BeautifulSoup) -> int:
+    def _extract_rating_count(self, soup: BeautifulSoup, html: str = None) -> int:
         """Extract number of ratings."""
-        # Look for rating count patterns
-        patterns = [
-            r'(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|thousand)?\s*ratings?',
-            r'"ratingCount":(\d+)',
-            r'(\d+)\s*reviews?'
-        ]
-        
-        html_str = str(soup)
-        for pattern in patterns:
-            matches = re.findall(pattern, html_str, re.IGNORECASE)
+        html_str = html if html is not None else str(soup)
+        for pattern in _RATING_COUNT_PATTERNS:
+            matches = pattern.findall(html_str)
             for match in matches:
                 try:
                     # Handle "k" notation (e.g., "1.2k" -> 1200)
@@ -392,18 +506,11 @@ class AppScraper:
         logger.warning("Could not extract rating count, defaulting to 0")
         return 0
     
-    def _extract_rating_avg(self, soup: BeautifulSoup) -> float:
+    def _extract_rating_avg(self, soup: BeautifulSoup, html: str = None) -> float:
         """Extract average rating."""
-        # Look for rating average patterns  
-        patterns = [
-            r'["\']?ratingValue["\']?\s*:\s*(\d+\.?\d*)',
-            r'(\d+\.?\d*)\s*out of\s*5',
-            r'(\d+\.?\d*)\s*stars?'
-        ]
-        
-        html_str = str(soup)
-        for pattern in patterns:
-            match = re.search(pattern, html_str, re.IGNORECASE)
+        html_str = html if html is not None else str(soup)
+        for pattern in _RATING_AVG_PATTERNS:
+            match = pattern.search(html_str)
             if match:
                 try:
                     rating = float(match.group(1))
@@ -413,9 +520,9 @@ class AppScraper:
                     continue
         
         # Look for star rating elements
-        star_elements = soup.find_all(attrs={"aria-label": re.compile(r"\d+\.?\d*\s*out of\s*5", re.IGNORECASE)})
+        star_elements = soup.find_all(attrs={"aria-label": _STARS_ARIA_PATTERN})
         for elem in star_elements:
-            match = re.search(r"(\d+\.?\d*)", elem.get("aria-label", ""))
+            match = _NUMBER_PATTERN.search(elem.get("aria-label", ""))
             if match:
                 try:
                     return float(match.group(1))
@@ -440,7 +547,7 @@ class AppScraper:
                 return len(desc_elem.get_text(strip=True))
         
         # Fallback: look for any element with "description" in class/id
-        desc_elements = soup.find_all(attrs={"class": re.compile(r"description", re.IGNORECASE)})
+        desc_elements = soup.find_all(attrs={"class": _DESCRIPTION_CLASS_PATTERN})
         if desc_elements:
             return len(desc_elements[0].get_text(strip=True))
         
@@ -455,15 +562,19 @@ class AppScraper:
             '[data-test-bcc="review-content"]'
         ]
         
-        reviews = []
+        # The selectors are alternate markups for the same review block,
+        # so the first one that matches wins; islice stops pulling from
+        # the generator once limit texts pass the length filter
         for selector in review_selectors:
-            review_elements = soup.select(selector)[:limit]
-            for elem in review_elements:
-                review_text = elem.get_text(strip=True)
-                if review_text and len(review_text) > 10:  # Filter very short reviews
-                    reviews.append(review_text)
-        
-        return reviews if reviews else None
+            reviews = list(islice(
+                (text for elem in soup.select(selector)
+                 if (text := elem.get_text(strip=True)) and len(text) > 10),
+                limit
+            ))
+            if reviews:
+                return reviews
+
+        return None
     
     def scrape_app(self, app_id: str, country: str = "us") -> AppPageData:
         """Scrape complete app information for given app ID.
@@ -479,12 +590,49 @@ class AppScraper:
             html = self.fetch_app_page(app_id, country)
             app_data = self.parse_app_page(html, app_id)
             
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
+            # Rate limiting, paced by server feedback
+            time.sleep(self._current_delay)
             
             logger.info(f"Successfully scraped app {app_id}")
             return app_data
             
         except Exception as e:
             logger.error(f"Failed to scrape app {app_id}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def scrape_apps(
+        self,
+        app_ids: List[str],
+        country: str = "us",
+        workers: int = 4
+    ) -> dict:
+        """Scrape a batch of apps concurrently.
+
+        scrape_app is I/O bound (network RTT plus the politeness sleep),
+        so a small thread pool overlaps requests; every worker still runs
+        through the shared session and adaptive delay.
+
+        Args:
+            app_ids: App Store app IDs to scrape
+            country: Country code applied to every app
+            workers: Number of concurrent scraper threads
+
+        Returns:
+            Map of app_id -> AppPageData for apps that scraped cleanly
+        """
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.scrape_app, app_id, country): app_id
+                for app_id in app_ids
+            }
+            for future in as_completed(futures):
+                app_id = futures[future]
+                try:
+                    results[app_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to scrape app {app_id}: {e}")
+
+        logger.info(f"Scraped {len(results)}/{len(app_ids)} apps")
+        return results
\ No newline at end of file
@@ -1,10 +1,18 @@
 """Data storage and caching for Trend Scout."""
 
 import logging
+import operator
+import queue
 import sqlite3
-from datetime import datetime, timedelta
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from supabase import create_client, Client
 from dotenv import load_dotenv
@@ -12,15 +20,104 @@ import os
 
 from .models import RawAppRecord, ScoredAppRecord, ScoutResultRow
 
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# app_html_cache.compressed codec flags; raw rows written by older
+# versions (or directly in tests) default to 0 and are returned as-is
+_CODEC_RAW = 0
+_CODEC_ZLIB = 1
+_CODEC_ZSTD = 2
+
 # Load environment variables
 load_dotenv()
 
 
+def _utcnow() -> datetime:
+    """Timezone-aware now(); datetime.utcnow() is deprecated in 3.12."""
+    return datetime.now(timezone.utc)
+
+
+def _today_iso() -> str:
+    """Today's UTC date as sortable ISO text, the app_ranks date format."""
+    return _utcnow().date().isoformat()
+
+# SQLite caps bound parameters at SQLITE_MAX_VARIABLE_NUMBER (32766);
+# app_ranks rows bind 6 values each
+_RANKS_INSERT_CHUNK = 32766 // 6
+
+# Above this many records, store_ranks drops the delta-lookup index and
+# rebuilds it after the load: one sorted build beats per-row maintenance
+_BULK_LOAD_THRESHOLD = 5000
+
+# Must match the idx_ranks_app_date definition in _init_db
+_RANKS_APP_DATE_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_ranks_app_date "
+    "ON app_ranks(app_id, date DESC, rank)"
+)
+
+
+@lru_cache(maxsize=8)
+def _ranks_insert_sql(row_count: int) -> str:
+    """Build a multi-row INSERT OR REPLACE statement for app_ranks.
+
+    Cached so the full-chunk and remainder statement strings are built
+    once and reused, letting sqlite3 reuse the prepared statement.
+    """
+    values = ", ".join(["(?, ?, ?, ?, ?, ?)"] * row_count)
+    return (
+        "INSERT OR REPLACE INTO app_ranks "
+        "(app_id, category, country, chart, rank, date) "
+        f"VALUES {values}"
+    )
+
+
+# App ids are staged in a per-connection temp table instead of inlined
+# as IN (?, ?, ...) placeholders, so this string never changes and the
+# compiled statement is reused from the cache regardless of batch size
+_RANK_DELTA_SQL = """
+    WITH ranked AS (
+        SELECT app_id, rank,
+            ROW_NUMBER() OVER (PARTITION BY app_id ORDER BY date DESC) AS rn_new,
+            ROW_NUMBER() OVER (PARTITION BY app_id ORDER BY date ASC) AS rn_old
+        FROM app_ranks
+        WHERE date >= ? AND app_id IN (SELECT app_id FROM tmp_ids)
+    )
+    SELECT app_id,
+        MAX(CASE WHEN rn_new = 1 THEN rank END) AS current_rank,
+        MAX(CASE WHEN rn_old = 1 THEN rank END) AS old_rank,
+        COUNT(*) AS row_count
+    FROM ranked
+    GROUP BY app_id
+"""
+
+
+# Hot-path statements as module constants: identical string identity lets
+# the connection's prepared-statement cache skip recompilation
+_HTML_INSERT_SQL = """
+    INSERT OR REPLACE INTO app_html_cache
+    (app_id, country, html, cached_at, compressed)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_HTML_SELECT_SQL = """
+    SELECT html, cached_at, compressed
+    FROM app_html_cache
+    WHERE app_id = ? AND country = ?
+"""
+
+
 class SQLiteCache:
     """Local SQLite cache for ranks and HTML data."""
-    
+
+    # Concurrent readers served without blocking the writer connection
+    _READ_POOL_SIZE = 4
+
     def __init__(self, db_path: str = "~/.trendscout/cache.db"):
         """Initialize SQLite cache.
         
@@ -30,11 +127,71 @@ class SQLiteCache:
         self.db_path = Path(db_path).expanduser()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
+        # One long-lived connection for all operations: avoids the
+        # ~200us open cost per call and lets sqlite3's prepared-statement
+        # cache reuse the compiled SQL (the hot statements below are
+        # module-level constants so the cache sees identical strings)
+        self._conn = self._connect()
+        # Reader pool: WAL serves any number of concurrent readers, so
+        # threaded delta/html lookups need not queue behind each other or
+        # a pending write on the writer connection. Pool members are
+        # ordinary connections (not PRAGMA query_only) because the delta
+        # query stages ids in each connection's temp table; treat them as
+        # read-only by convention.
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(self._READ_POOL_SIZE):
+            self._read_pool.put(self._connect())
+        # Reused codec objects: App Store pages compress ~10x, so cached
+        # rows span far fewer SQLite pages on both read and write
+        if ZSTD_AVAILABLE:
+            self._compressor = zstd.ZstdCompressor(level=6)
+            self._decompressor = zstd.ZstdDecompressor()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the cache's per-connection pragmas applied."""
+        # Plain tuple rows: the hot reads below index a couple of known
+        # columns by position, so the sqlite3.Row wrapper is pure overhead
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        # synchronous/temp_store/mmap_size/cache_size are per-connection;
+        # journal_mode=WAL is persistent and set once in _init_db
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        # Staging table for get_rank_deltas id batches; TEMP tables are
+        # per-connection and live in memory (temp_store=MEMORY above)
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS tmp_ids(app_id TEXT PRIMARY KEY)")
+        return conn
+
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a pooled connection for a read-only operation."""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
     def _init_db(self) -> None:
         """Initialize database tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # WAL avoids the fsync-per-commit cost of the rollback journal
+            # and lets readers run concurrently with writers. Combined with
+            # synchronous=NORMAL a power loss can drop the last commit(s),
+            # which is acceptable for a re-fetchable cache.
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Incremental auto-vacuum lets cleanup_old_data hand freed
+            # pages back instead of growing the file forever. The setting
+            # only takes effect after a VACUUM, which is free on a fresh
+            # database and a one-time cost when upgrading an existing one.
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+            self._migrate_app_ranks(conn)
             conn.executescript("""
+                -- WITHOUT ROWID stores rows directly in the primary-key
+                -- B-tree: one tree instead of a PK index plus a rowid
+                -- table, and no rowid->row indirection on lookups
                 CREATE TABLE IF NOT EXISTS app_ranks (
                     app_id TEXT,
                     category TEXT,
@@ -43,46 +200,112 @@ class SQLiteCache:
                     rank INTEGER,
                     date TEXT,
                     PRIMARY KEY (app_id, category, country, chart, date)
+                ) WITHOUT ROWID;
+                
+                CREATE TABLE IF NOT EXISTS app_meta (
+                    app_id TEXT PRIMARY KEY,
+                    name TEXT
                 );
                 
                 CREATE TABLE IF NOT EXISTS app_html_cache (
                     app_id TEXT,
                     country TEXT,
-                    html TEXT,
+                    html BLOB,
                     cached_at TEXT,
+                    compressed INTEGER DEFAULT 0,
                     PRIMARY KEY (app_id, country)
                 );
                 
-                CREATE INDEX IF NOT EXISTS idx_ranks_date 
-                ON app_ranks(date);
+                -- Serves the latest-date seek and rank ordering in
+                -- view_data.py, and the date-range DELETE in
+                -- cleanup_old_data (it subsumes the old idx_ranks_date)
+                CREATE INDEX IF NOT EXISTS idx_ranks_date_rank
+                ON app_ranks(date DESC, rank);
+
+                DROP INDEX IF EXISTS idx_ranks_date;
+
+                -- Covering index for get_rank_deltas: the (app_id, date)
+                -- window scan is satisfied from the index alone because
+                -- rank is included.
+                CREATE INDEX IF NOT EXISTS idx_ranks_app_date
+                ON app_ranks(app_id, date DESC, rank);
                 
                 CREATE INDEX IF NOT EXISTS idx_html_cached_at 
                 ON app_html_cache(cached_at);
             """)
+
+            # Migrate databases created before the compressed flag existed
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(app_html_cache)")}
+            if "compressed" not in columns:
+                conn.execute(
+                    "ALTER TABLE app_html_cache ADD COLUMN compressed INTEGER DEFAULT 0"
+                )
     
+    @staticmethod
+    def _migrate_app_ranks(conn: sqlite3.Connection) -> None:
+        """One-time rebuild of a pre-existing rowid app_ranks table."""
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'app_ranks'"
+        ).fetchone()
+        if row is None or "WITHOUT ROWID" in row[0]:
+            return
+
+        logger.info("Migrating app_ranks to WITHOUT ROWID")
+        with conn:
+            conn.execute("""
+                CREATE TABLE app_ranks_new (
+                    app_id TEXT,
+                    category TEXT,
+                    country TEXT,
+                    chart TEXT,
+                    rank INTEGER,
+                    date TEXT,
+                    PRIMARY KEY (app_id, category, country, chart, date)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                INSERT INTO app_ranks_new
+                SELECT app_id, category, country, chart, rank, date FROM app_ranks
+            """)
+            conn.execute("DROP TABLE app_ranks")
+            conn.execute("ALTER TABLE app_ranks_new RENAME TO app_ranks")
+
     def store_ranks(self, records: List[RawAppRecord]) -> None:
         """Store rank data from raw records.
         
         Args:
             records: List of raw app records to cache
         """
-        with sqlite3.connect(self.db_path) as conn:
-            date_str = datetime.utcnow().date().isoformat()
-            
-            for record in records:
-                conn.execute("""
-                    INSERT OR REPLACE INTO app_ranks 
-                    (app_id, category, country, chart, rank, date)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    record.app_id,
-                    record.category,
-                    record.country,
-                    record.chart,
-                    record.rank,
-                    date_str
-                ))
-        
+        date_str = _today_iso()
+        rows = [
+            (record.app_id, record.category, record.country, record.chart, record.rank, date_str)
+            for record in records
+        ]
+        names = [(record.app_id, record.name) for record in records]
+
+        # Pack many rows into each INSERT statement so the VDBE runs once
+        # per chunk instead of once per row, all in a single transaction.
+        # For backfill-sized loads, drop the delta-lookup index first and
+        # rebuild it afterwards in one sorted pass; readers under WAL keep
+        # seeing the pre-transaction snapshot until the commit.
+        bulk_load = len(rows) > _BULK_LOAD_THRESHOLD
+        with self._conn:
+            if bulk_load:
+                self._conn.execute("DROP INDEX IF EXISTS idx_ranks_app_date")
+            for start in range(0, len(rows), _RANKS_INSERT_CHUNK):
+                rows_chunk = rows[start:start + _RANKS_INSERT_CHUNK]
+                params = list(chain.from_iterable(rows_chunk))
+                self._conn.execute(_ranks_insert_sql(len(rows_chunk)), params)
+
+            # Keep the display-name catalog current so readers can join
+            # names in-band instead of mapping ids in Python
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO app_meta (app_id, name) VALUES (?, ?)", names
+            )
+
+            if bulk_load:
+                self._conn.execute(_RANKS_APP_DATE_INDEX_SQL)
+
         logger.info(f"Stored {len(records)} rank records in cache")
     
     def get_rank_deltas(self, app_ids: List[str], days_back: int = 7) -> Dict[str, int]:
@@ -96,25 +319,21 @@ class SQLiteCache:
             Dict mapping app_id to rank delta (negative = rank improved)
         """
         deltas = {}
-        cutoff_date = (datetime.utcnow() - timedelta(days=days_back)).date().isoformat()
+        cutoff_date = (_utcnow() - timedelta(days=days_back)).date().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            for app_id in app_ids:
-                # Get current and historical ranks for this app
-                cursor = conn.execute("""
-                    SELECT rank, date 
-                    FROM app_ranks 
-                    WHERE app_id = ? AND date >= ?
-                    ORDER BY date DESC
-                    LIMIT 2
-                """, (app_id, cutoff_date))
-                
-                rows = cursor.fetchall()
-                if len(rows) >= 2:
-                    current_rank = rows[0]['rank']
-                    old_rank = rows[-1]['rank']
+        # Stage the ids in the borrowed connection's temp table, then run
+        # one constant windowed query over them
+        with self._read_conn() as conn:
+            with conn:
+                conn.execute("DELETE FROM tmp_ids")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO tmp_ids VALUES (?)", ((a,) for a in app_ids)
+                )
+
+            cursor = conn.execute(_RANK_DELTA_SQL, (cutoff_date,))
+            for app_id, current_rank, old_rank, row_count in cursor:
+                # Need at least two observations to compute a delta
+                if row_count >= 2:
                     deltas[app_id] = current_rank - old_rank
         
         logger.debug(f"Computed rank deltas for {len(deltas)}/{len(app_ids)} apps")
@@ -128,12 +347,27 @@ class SQLiteCache:
             country: Country code
             html: HTML content to cache
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO app_html_cache 
-                (app_id, country, html, cached_at)
-                VALUES (?, ?, ?, ?)
-            """, (app_id, country, html, datetime.utcnow().isoformat()))
+        self.store_html_many([(app_id, country, html)])
+
+    def store_html_many(self, items: List[Tuple[str, str, str]]) -> None:
+        """Store HTML content for many app pages in one transaction.
+
+        Args:
+            items: List of (app_id, country, html) tuples
+        """
+        if not items:
+            return
+
+        cached_at = _utcnow().isoformat()
+        rows = []
+        for app_id, country, html in items:
+            blob, codec = self._compress_html(html)
+            rows.append((app_id, country, blob, cached_at, codec))
+
+        # One executemany in one transaction: callers persist thousands of
+        # pages per run, and per-call transactions were the dominant cost
+        with self._conn:
+            self._conn.executemany(_HTML_INSERT_SQL, rows)
     
     def get_html(self, app_id: str, country: str, max_age_hours: int = 168) -> Optional[str]:
         """Get cached HTML if not too old.
@@ -146,22 +380,19 @@ class SQLiteCache:
         Returns:
             Cached HTML or None if not found/too old
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT html, cached_at 
-                FROM app_html_cache 
-                WHERE app_id = ? AND country = ?
-            """, (app_id, country))
-            
-            row = cursor.fetchone()
-            if row:
-                cached_at = datetime.fromisoformat(row['cached_at'])
-                if cached_at > cutoff_time:
-                    return row['html']
+        cutoff_time = _utcnow() - timedelta(hours=max_age_hours)
         
+        with self._read_conn() as conn:
+            row = conn.execute(_HTML_SELECT_SQL, (app_id, country)).fetchone()
+        if row:
+            html, cached_at_str, compressed = row
+            cached_at = datetime.fromisoformat(cached_at_str)
+            if cached_at.tzinfo is None:
+                # Rows written before timestamps carried an offset are UTC
+                cached_at = cached_at.replace(tzinfo=timezone.utc)
+            if cached_at > cutoff_time:
+                return self._decompress_html(html, compressed)
+
         return None
     
     def cleanup_old_data(self, days_to_keep: int = 30) -> None:
@@ -170,24 +401,82 @@ class SQLiteCache:
         Args:
             days_to_keep: Number of days of data to retain
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=days_to_keep)).date().isoformat()
-        cutoff_time = (datetime.utcnow() - timedelta(days=days_to_keep)).isoformat()
+        cutoff_date = (_utcnow() - timedelta(days=days_to_keep)).date().isoformat()
+        cutoff_time = (_utcnow() - timedelta(days=days_to_keep)).isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn:
             # Clean old ranks
-            conn.execute("DELETE FROM app_ranks WHERE date < ?", (cutoff_date,))
-            
+            self._conn.execute("DELETE FROM app_ranks WHERE date < ?", (cutoff_date,))
+
             # Clean old HTML cache
-            conn.execute("DELETE FROM app_html_cache WHERE cached_at < ?", (cutoff_time,))
-            
-            conn.commit()
-        
+            self._conn.execute("DELETE FROM app_html_cache WHERE cached_at < ?", (cutoff_time,))
+
+        # Return the freed pages to the filesystem (auto_vacuum=INCREMENTAL
+        # only moves them to the freelist) and refresh planner statistics
+        # now that the row distribution has shifted
+        self._conn.execute("PRAGMA incremental_vacuum")
+        self._conn.execute("PRAGMA optimize")
+
         logger.info(f"Cleaned cache data older than {days_to_keep} days")
 
+    def _compress_html(self, html: str) -> tuple:
+        """Compress HTML for storage, returning (blob, codec_flag)."""
+        data = html.encode("utf-8")
+        if ZSTD_AVAILABLE:
+            return self._compressor.compress(data), _CODEC_ZSTD
+        return zlib.compress(data, 6), _CODEC_ZLIB
+
+    def _decompress_html(self, blob, codec: int) -> str:
+        """Reverse _compress_html, honouring the row's codec flag."""
+        if codec == _CODEC_ZSTD:
+            return self._decompressor.decompress(blob).decode("utf-8")
+        if codec == _CODEC_ZLIB:
+            return zlib.decompress(blob).decode("utf-8")
+        return blob
+
+    def close(self) -> None:
+        """Close the writer connection and the reader pool."""
+        if getattr(self, "_conn", None) is not None:
+            self._conn.close()
+            self._conn = None
+        pool = getattr(self, "_read_pool", None)
+        if pool is not None:
+            while not pool.empty():
+                pool.get_nowait().close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# Conflict target for publish_results upserts; must match the
+# idx_scout_results_unique index defined in supabase.sql
+_UPSERT_CONFLICT = "generated_at,app_id,country,chart"
+
+# Column names paired with one attrgetter pull per record: a single
+# C-level call replaces 19 LOAD_ATTR lookups in convert_to_db_rows
+_DB_ROW_FIELDS = (
+    "category", "country", "chart", "rank", "app_id", "bundle_id", "name",
+    "price", "has_iap", "rating_count", "rating_avg", "desc_len",
+    "rank_delta7d", "demand", "monetization", "low_complexity", "moat_risk",
+    "total", "raw",
+)
+_DB_ROW_GETTER = operator.attrgetter(
+    "category", "country", "chart", "rank", "app_id", "bundle_id", "name",
+    "price", "has_iap", "rating_count", "rating_avg", "desc_len",
+    "rank_delta7d", "demand", "monetization", "low_complexity", "moat_risk",
+    "total", "raw_data",
+)
+
 
 class SupabasePublisher:
     """Publisher for Supabase database."""
-    
+
+    # How long get_latest_batch_time may serve a memoized answer
+    _LATEST_TTL_SECONDS = 30.0
+
     def __init__(self, url: Optional[str] = None, service_key: Optional[str] = None):
         """Initialize Supabase client.
         
@@ -205,6 +494,9 @@ class SupabasePublisher:
             )
         
         self.client: Client = create_client(self.url, self.service_key)
+        # (value, fetched_at) for get_latest_batch_time; the value changes
+        # at most once per publish, so status polls reuse it for a while
+        self._latest_cache = (None, 0.0)
         logger.info("Initialized Supabase client")
     
     def convert_to_db_rows(self, scored_records: List[ScoredAppRecord]) -> List[dict]:
@@ -216,34 +508,14 @@ class SupabasePublisher:
         Returns:
             List of dictionaries for database insertion
         """
-        generated_at = datetime.utcnow()
-        
-        db_rows = []
-        for record in scored_records:
-            row = {
-                "generated_at": generated_at.isoformat(),
-                "category": record.category,
-                "country": record.country,
-                "chart": record.chart,
-                "rank": record.rank,
-                "app_id": record.app_id,
-                "bundle_id": record.bundle_id,
-                "name": record.name,
-                "price": record.price,
-                "has_iap": record.has_iap,
-                "rating_count": record.rating_count,
-                "rating_avg": record.rating_avg,
-                "desc_len": record.desc_len,
-                "rank_delta7d": record.rank_delta7d,
-                "demand": record.demand,
-                "monetization": record.monetization,
-                "low_complexity": record.low_complexity,
-                "moat_risk": record.moat_risk,
-                "total": record.total,
-                "raw": record.raw_data
-            }
-            db_rows.append(row)
-        
+        generated_at_iso = _utcnow().isoformat()
+
+        db_rows: List[dict] = [None] * len(scored_records)
+        for i, record in enumerate(scored_records):
+            row = dict(zip(_DB_ROW_FIELDS, _DB_ROW_GETTER(record)))
+            row["generated_at"] = generated_at_iso
+            db_rows[i] = row
+
         return db_rows
     
     def publish_results(self, scored_records: List[ScoredAppRecord]) -> bool:
@@ -261,24 +533,34 @@ class SupabasePublisher:
         
         try:
             db_rows = self.convert_to_db_rows(scored_records)
-            generated_at = db_rows[0]["generated_at"]
-            
-            # Delete any existing records with the same generated_at to ensure idempotency
-            self.client.table("scout_results").delete().eq(
-                "generated_at", generated_at
-            ).execute()
-            
-            # Insert new records in batches
-            batch_size = 100
-            for i in range(0, len(db_rows), batch_size):
-                batch = db_rows[i:i + batch_size]
-                
-                result = self.client.table("scout_results").insert(batch).execute()
-                
+
+            # Upsert replaces the old DELETE+INSERT idempotency dance: one
+            # round-trip per batch and no full-table DELETE scan. Conflicts
+            # resolve against the idx_scout_results_unique index.
+            batch_size = 500
+            batches = [db_rows[i:i + batch_size] for i in range(0, len(db_rows), batch_size)]
+
+            def send_batch(batch: List[dict]):
+                return self.client.table("scout_results").upsert(
+                    batch, on_conflict=_UPSERT_CONFLICT
+                ).execute()
+
+            if len(batches) == 1:
+                results = [send_batch(batches[0])]
+            else:
+                # Overlap the HTTPS round-trips; bounded so we stay under
+                # PostgREST rate limits
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    results = list(executor.map(send_batch, batches))
+
+            for i, result in enumerate(results):
                 if not result.data:
-                    logger.error(f"Failed to insert batch {i//batch_size + 1}")
+                    logger.error(f"Failed to upsert batch {i + 1}")
                     return False
-            
+
+            # The latest batch just changed; drop the memoized timestamp
+            self._latest_cache = (None, 0.0)
+
             logger.info(f"Successfully published {len(scored_records)} records to Supabase")
             return True
             
@@ -307,15 +589,21 @@ class SupabasePublisher:
         Returns:
             Datetime of latest batch or None if no data
         """
+        value, fetched_at = self._latest_cache
+        if time.monotonic() - fetched_at < self._LATEST_TTL_SECONDS:
+            return value
+
         try:
             result = self.client.table("scout_results").select(
                 "generated_at"
             ).order("generated_at", desc=True).limit(1).execute()
             
+            value = None
             if result.data:
-                return datetime.fromisoformat(result.data[0]["generated_at"].replace("Z", "+00:00"))
-            
-            return None
+                value = datetime.fromisoformat(result.data[0]["generated_at"].replace("Z", "+00:00"))
+
+            self._latest_cache = (value, time.monotonic())
+            return value
             
         except Exception as e:
             logger.error(f"Failed to get latest batch time: {e}")
@@ -340,7 +628,10 @@ class DataStore:
         """
         self.cache = SQLiteCache(cache_path)
         self.publisher = SupabasePublisher(supabase_url, supabase_key)
-    
+        # Single worker so cached writes and publishes stay ordered while
+        # overlapping with the caller's next fetch/score stage
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+
     def store_and_publish(self, scored_records: List[ScoredAppRecord]) -> bool:
         """Store records in cache and publish to Supabase.
         
@@ -351,24 +642,9 @@ class DataStore:
             True if both operations successful, False otherwise
         """
         try:
-            # Convert to raw records for cache storage
-            raw_records = []
-            for scored in scored_records:
-                raw_record = RawAppRecord(
-                    category=scored.category,
-                    country=scored.country,
-                    chart=scored.chart,
-                    rank=scored.rank,
-                    app_id=scored.app_id,
-                    name=scored.name,
-                    rss_url=scored.rss_url,
-                    fetched_at=scored.fetched_at,
-                    raw_data=scored.raw_data
-                )
-                raw_records.append(raw_record)
-            
-            # Store in cache
-            self.cache.store_ranks(raw_records)
+            # ScoredAppRecord extends RawAppRecord, so the cache can read
+            # the rank fields directly — no per-record rebuild/validation
+            self.cache.store_ranks(scored_records)
             
             # Publish to Supabase
             success = self.publisher.publish_results(scored_records)
@@ -381,7 +657,33 @@ class DataStore:
         except Exception as e:
             logger.error(f"Failed to store and publish results: {e}")
             return False
-    
+
+    def store_and_publish_async(self, scored_records: List[ScoredAppRecord]) -> "Future[bool]":
+        """Queue store_and_publish on a background thread.
+
+        Lets a pipelined caller start collecting the next batch while
+        SQLite and Supabase I/O for this one completes. Errors surface
+        through the returned future; call wait_for_publishes() before
+        shutdown to drain pending work.
+
+        Args:
+            scored_records: List of scored app records
+
+        Returns:
+            Future resolving to store_and_publish's boolean result
+        """
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="datastore-io"
+            )
+        return self._io_executor.submit(self.store_and_publish, scored_records)
+
+    def wait_for_publishes(self) -> None:
+        """Block until all queued background publishes have finished."""
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+
     def check_health(self) -> Dict[str, bool]:
         """Check health of all storage components.
         
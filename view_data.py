@@ -23,12 +23,14 @@ def main():
     with sqlite3.connect(cache_path) as conn:
         conn.row_factory = sqlite3.Row
         
-        # Get summary
-        cursor = conn.execute("SELECT COUNT(*) as count FROM app_ranks")
-        total_ranks = cursor.fetchone()['count']
-        
-        cursor = conn.execute("SELECT COUNT(*) as count FROM app_html_cache")
-        total_html = cursor.fetchone()['count']
+        # Get summary: both counts in one statement, one VDBE pass
+        cursor = conn.execute("""
+            SELECT (SELECT COUNT(*) FROM app_ranks) AS ranks,
+                   (SELECT COUNT(*) FROM app_html_cache) AS pages
+        """)
+        summary = cursor.fetchone()
+        total_ranks = summary['ranks']
+        total_html = summary['pages']
         
         print(f"📊 Data Summary:")
         print(f"   • App rankings: {total_ranks}")
@@ -36,12 +38,16 @@ def main():
         print(f"   • Database: {cache_path}")
         print()
         
-        # Get latest rankings
+        # Get latest rankings: MAX(date) is an index-only seek on
+        # idx_ranks_date_rank, which also provides the rank ordering.
+        # Names come from the app_meta catalog in the same pass.
         cursor = conn.execute('''
-            SELECT app_id, category, country, chart, rank, date 
-            FROM app_ranks 
-            WHERE date = (SELECT MAX(date) FROM app_ranks)
-            ORDER BY rank ASC
+            WITH md AS (SELECT MAX(date) AS d FROM app_ranks)
+            SELECT r.app_id, r.category, r.country, r.chart, r.rank, r.date,
+                   COALESCE(m.name, 'App ' || r.app_id) AS app_name
+            FROM app_ranks r JOIN md ON r.date = md.d
+            LEFT JOIN app_meta m ON m.app_id = r.app_id
+            ORDER BY r.rank ASC
         ''')
         
         rankings = cursor.fetchall()
@@ -51,23 +57,8 @@ def main():
             print(f"   📂 {latest['category']} | 🌍 {latest['country']} | 📈 {latest['chart']}")
             print("-" * 40)
             
-            # App names
-            app_names = {
-                '284815942': 'Google',
-                '535886823': 'Google Chrome', 
-                '388497605': 'Google Authenticator',
-                '1288723196': 'Microsoft Edge',
-                '1510944943': 'Cleanup Storage Cleaner',
-                '1178765645': 'Xfinity',
-                '1476380919': 'Cleaner Guru',
-                '416023011': 'My Verizon',
-                '6448330325': 'AI Cleaner',
-                '942608209': 'My Spectrum'
-            }
-            
             for row in rankings:
-                app_name = app_names.get(row['app_id'], f"App {row['app_id']}")
-                print(f"{row['rank']:2d}. {app_name}")
+                print(f"{row['rank']:2d}. {row['app_name']}")
                 print(f"    📱 {row['app_id']}")
         
         print()